@@ -31,12 +31,13 @@ class ConnectionManager:
             if not self.active_connections[debate_id]:
                 del self.active_connections[debate_id]
 
-    async def broadcast(self, debate_id: UUID, message: dict):
+    async def broadcast(self, debate_id: UUID, message: str):
+        """Send an already-serialized JSON message to every subscriber."""
         if debate_id in self.active_connections:
             disconnected = []
             for connection in self.active_connections[debate_id]:
                 try:
-                    await connection.send_json(message)
+                    await connection.send_text(message)
                 except Exception:
                     disconnected.append(connection)
             # Clean up disconnected
@@ -85,10 +86,8 @@ async def debate_websocket(websocket: WebSocket, debate_id: UUID):
 
 async def broadcast_debate_update(update: DebateUpdate):
     """Broadcast a debate update to all connected clients."""
+    # Serialize once for all subscribers rather than once per connection
     await manager.broadcast(
         update.debate_id,
-        {
-            "event_type": update.event_type,
-            "data": update.data,
-        },
+        update.model_dump_json(include={"event_type", "data"}),
     )
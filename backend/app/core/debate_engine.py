@@ -5,9 +5,14 @@ Core logic for managing multi-agent debates, rounds, and voting.
 """
 
 import asyncio
+import inspect
 import logging
+import operator
+import re
+import time
 from collections.abc import Callable
 from datetime import datetime, timezone
+from uuid import UUID
 
 from app.models import (
     AgentConfig,
@@ -21,9 +26,29 @@ from app.models import (
     VoteType,
 )
 from app.providers import ProviderRegistry
+from app.providers.base import BaseProvider
 
 logger = logging.getLogger(__name__)
 
+# Fields rendered for every response when building context and voting prompts
+_response_fields = operator.attrgetter("agent_name", "role", "content")
+
+# Streamed chunks are coalesced into one event per interval or batch, whichever comes first
+_CHUNK_FLUSH_INTERVAL = 0.05  # seconds
+_CHUNK_FLUSH_SIZE = 32
+
+# DISAGREE is listed first so it wins over the AGREE it contains
+_VOTE_TOKEN_PATTERN = re.compile(r"\b(DISAGREE|AGREE|ABSTAIN)")
+_VOTE_MAP: dict[str, VoteType] = {
+    "AGREE": VoteType.AGREE,
+    "DISAGREE": VoteType.DISAGREE,
+    "ABSTAIN": VoteType.ABSTAIN,
+}
+
+# Self-reported vote confidence, used to weight votes when checking consensus
+_CONFIDENCE_PATTERN = re.compile(r"^\s*CONFIDENCE:\s*\[?\s*(\d*\.?\d+)", re.MULTILINE)
+_DEFAULT_VOTE_CONFIDENCE = 0.5
+
 
 class DebateEngine:
     """Engine for orchestrating multi-agent debates."""
@@ -37,13 +62,47 @@ class DebateEngine:
             status=DebateStatus.IN_PROGRESS,
         )
         self._event_callbacks: list[Callable[[DebateUpdate], None]] = []
+        # Rendered text of completed rounds, extended as new rounds finish
+        self._rendered_rounds: list[str] = []
+        # Resolve each agent's provider once instead of on every response/vote
+        self._providers: dict[UUID, BaseProvider | None] = {
+            agent.id: ProviderRegistry.get(agent.provider) for agent in council.agents
+        }
+        # System prompts are fixed per agent for the whole debate, so build them once
+        self._system_prompts: dict[UUID, str] = {}
+        self._vote_system_prompts: dict[UUID, str] = {}
 
     def on_event(self, callback: Callable[[DebateUpdate], None]) -> None:
         """Register callback for debate events."""
         self._event_callbacks.append(callback)
 
+    def _get_provider(self, agent: AgentConfig) -> BaseProvider:
+        """Get the cached provider for an agent, resolving agents added after init."""
+        if agent.id not in self._providers:
+            self._providers[agent.id] = ProviderRegistry.get(agent.provider)
+        provider = self._providers[agent.id]
+        if not provider:
+            logger.error(f"Provider {agent.provider} not available for agent {agent.name}")
+            raise ValueError(f"Provider {agent.provider} not available")
+        return provider
+
+    def _get_system_prompt(self, agent: AgentConfig, provider: BaseProvider) -> str:
+        """Get the cached response system prompt for an agent."""
+        if agent.id not in self._system_prompts:
+            self._system_prompts[agent.id] = provider.get_system_prompt(agent)
+        return self._system_prompts[agent.id]
+
+    def _get_vote_system_prompt(self, agent: AgentConfig) -> str:
+        """Get the cached voting system prompt for an agent."""
+        if agent.id not in self._vote_system_prompts:
+            self._vote_system_prompts[agent.id] = f"""You are {agent.name}, a {agent.role.value}. 
+You must vote on whether consensus has been reached based on the discussion."""
+        return self._vote_system_prompts[agent.id]
+
     async def _emit_event(self, event_type: str, data: dict) -> None:
         """Emit event to all registered callbacks."""
+        if not self._event_callbacks:
+            return
         update = DebateUpdate(
             debate_id=self.debate.id,
             event_type=event_type,
@@ -98,8 +157,6 @@ class DebateEngine:
         """Run a single debate round with all agents in parallel."""
         await self._emit_event("round_start", {"round": round_number})
 
-        round_result = DebateRound(round_number=round_number)
-
         # Build context from previous rounds
         context = self._build_round_context(round_number)
 
@@ -119,14 +176,22 @@ class DebateEngine:
             self._stream_and_collect_response(agent, context, round_number)
             for agent in self.council.agents
         ]
-        responses = await asyncio.gather(*response_tasks, return_exceptions=True)
+        results = await asyncio.gather(*response_tasks, return_exceptions=True)
 
-        # Process results and emit completion events
-        for response in responses:
-            if isinstance(response, Exception):
-                logger.error(f"Agent response failed: {response}")
-                continue
-            round_result.responses.append(response)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Agent response failed: {result}")
+
+        # gather preserves agent order, so the round is built from the results in one go
+        round_result = DebateRound(
+            round_number=round_number,
+            responses=[result for result in results if not isinstance(result, Exception)],
+        )
+        # Position of each agent's response, for attaching votes below
+        response_index = {resp.agent_id: index for index, resp in enumerate(round_result.responses)}
+
+        # Emit completion events
+        for response in round_result.responses:
             await self._emit_event(
                 "agent_response",
                 {
@@ -146,18 +211,25 @@ class DebateEngine:
         vote_results = await asyncio.gather(*vote_tasks, return_exceptions=True)
 
         # Process vote results
+        confidences: dict[str, float] = {}
         for agent, vote_response in zip(self.council.agents, vote_results, strict=True):
             if isinstance(vote_response, Exception):
                 logger.error(f"Vote from {agent.name} failed: {vote_response}")
                 continue
 
             round_result.votes[str(agent.id)] = vote_response.vote
+            confidences[str(agent.id)] = vote_response.confidence
 
             # Update response with vote info
-            for resp in round_result.responses:
-                if resp.agent_id == agent.id:
-                    resp.vote = vote_response.vote
-                    resp.reasoning = vote_response.reasoning
+            index = response_index.get(agent.id)
+            if index is not None:
+                round_result.responses[index] = round_result.responses[index].model_copy(
+                    update={
+                        "vote": vote_response.vote,
+                        "reasoning": vote_response.reasoning,
+                        "confidence": vote_response.confidence,
+                    }
+                )
 
             await self._emit_event(
                 "vote",
@@ -171,7 +243,10 @@ class DebateEngine:
 
         # Calculate vote summary
         round_result.vote_summary = self._calculate_vote_summary(round_result.votes)
-        round_result.consensus_reached = self._check_consensus(round_result.vote_summary)
+        round_result.consensus_reached = self._check_consensus(
+            round_result.vote_summary,
+            self._calculate_weighted_summary(round_result.votes, confidences),
+        )
 
         await self._emit_event(
             "round_complete",
@@ -189,15 +264,20 @@ class DebateEngine:
         if current_round == 1:
             return f"This is the first round of debate on the topic: {self.topic}"
 
-        context_parts = [f"Topic: {self.topic}\n\nPrevious rounds:"]
-        for round_data in self.debate.rounds:
-            context_parts.append(f"\n--- Round {round_data.round_number} ---")
-            for resp in round_data.responses:
-                context_parts.append(f"\n{resp.agent_name} ({resp.role.value}):\n{resp.content}")
-            if round_data.vote_summary:
-                context_parts.append(f"\nVotes: {round_data.vote_summary}")
+        # Completed rounds never change, so only render the ones added since the last call
+        for round_data in self.debate.rounds[len(self._rendered_rounds) :]:
+            self._rendered_rounds.append(self._render_round(round_data))
 
-        return "\n".join(context_parts)
+        return "\n".join([f"Topic: {self.topic}\n\nPrevious rounds:", *self._rendered_rounds])
+
+    def _render_round(self, round_data: DebateRound) -> str:
+        """Render a single completed round for inclusion in the context."""
+        parts = [f"\n--- Round {round_data.round_number} ---"]
+        for name, role, content in map(_response_fields, round_data.responses):
+            parts.append(f"\n{name} ({role.value}):\n{content}")
+        if round_data.vote_summary:
+            parts.append(f"\nVotes: {round_data.vote_summary}")
+        return "\n".join(parts)
 
     async def _stream_and_collect_response(
         self, agent: AgentConfig, context: str, round_number: int
@@ -206,12 +286,9 @@ class DebateEngine:
         logger.info(
             f"Streaming response from {agent.name} ({agent.provider.value}) for round {round_number}"
         )
-        provider = ProviderRegistry.get(agent.provider)
-        if not provider:
-            logger.error(f"Provider {agent.provider} not available for agent {agent.name}")
-            raise ValueError(f"Provider {agent.provider} not available")
+        provider = self._get_provider(agent)
 
-        system_prompt = provider.get_system_prompt(agent)
+        system_prompt = self._get_system_prompt(agent, provider)
         user_message = f"""You are participating in a council debate on the following topic:
 
 {context}
@@ -270,12 +347,11 @@ Be concise but thorough. Focus on your area of expertise ({agent.role.value}).
 
                 async def consume_stream():
                     nonlocal full_content
-                    async for chunk in provider.generate_stream(
-                        system_prompt=system_prompt,
-                        user_message=user_message,
-                        model=agent.model,
-                    ):
-                        full_content += chunk
+                    pending: list[str] = []
+                    last_flush = float("-inf")
+
+                    async def flush_chunks():
+                        nonlocal last_flush
                         await self._emit_event(
                             "agent_response_chunk",
                             {
@@ -284,10 +360,62 @@ Be concise but thorough. Focus on your area of expertise ({agent.role.value}).
                                 "agent_name": agent.name,
                                 "role": agent.role.value,
                                 "provider": agent.provider.value,
-                                "chunk": chunk,
+                                "chunk": "".join(pending),
                                 "full_content_so_far": full_content,
                             },
                         )
+                        pending.clear()
+                        last_flush = time.monotonic()
+
+                    stream = provider.generate_stream(
+                        system_prompt=system_prompt,
+                        user_message=user_message,
+                        model=agent.model,
+                    )
+                    # A single reader task drains the stream, so a timed wait on the
+                    # queue never cancels the provider's generator mid-chunk
+                    received: asyncio.Queue[str | None] = asyncio.Queue()
+
+                    async def read_stream():
+                        try:
+                            async for chunk in stream:
+                                received.put_nowait(chunk)
+                        finally:
+                            received.put_nowait(None)
+
+                    reader = asyncio.create_task(read_stream())
+                    try:
+                        while True:
+                            if pending:
+                                # Flush buffered text if the stream stalls past the interval
+                                remaining = _CHUNK_FLUSH_INTERVAL - (time.monotonic() - last_flush)
+                                try:
+                                    async with asyncio.timeout(max(remaining, 0)):
+                                        chunk = await received.get()
+                                except TimeoutError:
+                                    await flush_chunks()
+                                    chunk = await received.get()
+                            else:
+                                chunk = await received.get()
+                            if chunk is None:
+                                break
+                            full_content += chunk
+                            pending.append(chunk)
+                            if (
+                                len(pending) >= _CHUNK_FLUSH_SIZE
+                                or time.monotonic() - last_flush >= _CHUNK_FLUSH_INTERVAL
+                            ):
+                                await flush_chunks()
+                        # Re-raise any error from the provider's stream
+                        await reader
+                    finally:
+                        reader.cancel()
+                        await asyncio.gather(reader, return_exceptions=True)
+                        if inspect.isasyncgen(stream):
+                            await stream.aclose()
+
+                    if pending:
+                        await flush_chunks()
 
                 await asyncio.wait_for(consume_stream(), timeout=90.0)
 
@@ -311,18 +439,17 @@ Be concise but thorough. Focus on your area of expertise ({agent.role.value}).
     ) -> AgentResponse:
         """Get a vote from an agent after seeing all responses."""
         logger.info(f"Getting vote from {agent.name} ({agent.provider.value})")
-        provider = ProviderRegistry.get(agent.provider)
-        if not provider:
-            logger.error(f"Provider {agent.provider} not available for agent {agent.name}")
-            raise ValueError(f"Provider {agent.provider} not available")
+        provider = self._get_provider(agent)
 
         # Build summary of all responses for voting
         responses_text = "\n\n".join(
-            [f"{r.agent_name} ({r.role.value}):\n{r.content}" for r in responses]
+            [
+                f"{name} ({role.value}):\n{content}"
+                for name, role, content in map(_response_fields, responses)
+            ]
         )
 
-        system_prompt = f"""You are {agent.name}, a {agent.role.value}. 
-You must vote on whether consensus has been reached based on the discussion."""
+        system_prompt = self._get_vote_system_prompt(agent)
 
         user_message = f"""Based on the following responses from all council members:
 
@@ -331,6 +458,7 @@ You must vote on whether consensus has been reached based on the discussion."""
 Please vote and explain your reasoning.
 Respond in this exact format:
 VOTE: [AGREE/DISAGREE/ABSTAIN]
+CONFIDENCE: [A number from 0.0 to 1.0 for how confident you are in your vote]
 REASONING: [Your brief explanation]
 
 Vote AGREE if you believe the council is converging on a reasonable conclusion.
@@ -359,11 +487,19 @@ Vote ABSTAIN if you're uncertain or need more information.
 
         if "VOTE:" in response_text:
             vote_line = response_text.split("VOTE:")[1].split("\n")[0].strip().upper()
-            # Check DISAGREE first since it contains "AGREE" as a substring
-            if "DISAGREE" in vote_line:
-                vote = VoteType.DISAGREE
-            elif "AGREE" in vote_line:
-                vote = VoteType.AGREE
+            match = _VOTE_TOKEN_PATTERN.search(vote_line)
+            if match:
+                vote = _VOTE_MAP.get(match.group(1), VoteType.ABSTAIN)
+
+        confidence = _DEFAULT_VOTE_CONFIDENCE
+        confidence_match = _CONFIDENCE_PATTERN.search(response_text.upper())
+        if confidence_match:
+            reported = float(confidence_match.group(1))
+            if reported > 1.0:
+                # Read values such as "85" as percentages; anything larger keeps the default
+                reported /= 100
+            if reported <= 1.0:
+                confidence = reported
 
         if "REASONING:" in response_text:
             reasoning = response_text.split("REASONING:")[1].strip()
@@ -376,6 +512,7 @@ Vote ABSTAIN if you're uncertain or need more information.
             content="",
             vote=vote,
             reasoning=reasoning,
+            confidence=confidence,
         )
 
     def _calculate_vote_summary(self, votes: dict[str, VoteType]) -> dict[str, int]:
@@ -385,12 +522,37 @@ Vote ABSTAIN if you're uncertain or need more information.
             summary[vote.value] += 1
         return summary
 
-    def _check_consensus(self, vote_summary: dict[str, int]) -> bool:
-        """Check if consensus threshold has been reached."""
-        total = sum(vote_summary.values())
+    def _calculate_weighted_summary(
+        self, votes: dict[str, VoteType], confidences: dict[str, float]
+    ) -> dict[str, float]:
+        """Calculate vote totals weighted by each agent's confidence."""
+        summary = {"agree": 0.0, "disagree": 0.0, "abstain": 0.0}
+        for agent_id, vote in votes.items():
+            summary[vote.value] += confidences.get(agent_id, _DEFAULT_VOTE_CONFIDENCE)
+        return summary
+
+    def _check_consensus(
+        self,
+        vote_summary: dict[str, int],
+        weighted_summary: dict[str, float] | None = None,
+    ) -> bool:
+        """Check if consensus threshold has been reached.
+
+        When confidence-weighted totals are given they take precedence over raw
+        counts, so a confident majority can settle the debate without another
+        round. With equal confidences both give the same result. Weighting never
+        lets a minority win: agree votes must still outnumber disagree votes, and
+        all-zero confidences fall back to the raw counts.
+        """
+        summary = vote_summary
+        if weighted_summary is not None and sum(weighted_summary.values()) > 0:
+            if vote_summary["agree"] <= vote_summary["disagree"]:
+                return False
+            summary = weighted_summary
+        total = sum(summary.values())
         if total == 0:
             return False
-        agree_ratio = vote_summary["agree"] / total
+        agree_ratio = summary["agree"] / total
         return agree_ratio >= self.council.consensus_threshold
 
     async def _generate_summary(self) -> str:
@@ -66,6 +66,7 @@ SCHEMA = [
         content TEXT NOT NULL,
         vote TEXT,
         reasoning TEXT,
+        confidence REAL,
         timestamp TEXT NOT NULL,
         FOREIGN KEY (debate_id) REFERENCES debates(id) ON DELETE CASCADE
     );
@@ -90,6 +91,31 @@ SCHEMA = [
         FOREIGN KEY (debate_id) REFERENCES debates(id) ON DELETE CASCADE
     );
     """,
+    # Child rows are always read and replaced by their parent's id
+    """
+    CREATE INDEX IF NOT EXISTS idx_council_agents_council
+    ON council_agents (council_id, sort_order);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_debates_council
+    ON debates (council_id, created_at);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_debate_rounds_debate
+    ON debate_rounds (debate_id, round_number);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_debate_responses_debate
+    ON debate_responses (debate_id, round_number);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_debate_votes_debate
+    ON debate_votes (debate_id, round_number);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_debate_points_debate
+    ON debate_points (debate_id, sort_order);
+    """,
 ]
 
 
@@ -100,4 +126,9 @@ async def init_db(db_path: Path) -> None:
         await connection.execute("PRAGMA foreign_keys=ON;")
         for statement in SCHEMA:
             await connection.execute(statement)
+        # Databases created before vote confidence was stored lack the column
+        cursor = await connection.execute("PRAGMA table_info(debate_responses);")
+        columns = {row[1] for row in await cursor.fetchall()}
+        if "confidence" not in columns:
+            await connection.execute("ALTER TABLE debate_responses ADD COLUMN confidence REAL;")
         await connection.commit()
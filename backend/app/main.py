@@ -36,6 +36,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     await app.state.oauth_server.close()
+    await Storage.close()
     print("👋 AgentsCouncil Backend shutting down...")
 
 
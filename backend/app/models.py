@@ -2,12 +2,24 @@
 AgentsCouncil Backend - Data Models
 """
 
+import random
+import sys
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from uuid import UUID, uuid4
+from types import MappingProxyType
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+_RANDOM = random.SystemRandom()
+
+
+def _new_id() -> UUID:
+    """Generate a random (version 4) UUID from a shared SystemRandom instance."""
+    return UUID(int=_RANDOM.getrandbits(128), version=4)
 
-from pydantic import BaseModel, Field
 
 # === Enums ===
 
@@ -59,7 +71,7 @@ class DebateStatus(str, Enum):
 class AgentConfig(BaseModel):
     """Configuration for a single AI agent in the council."""
 
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=_new_id)
     name: str
     provider: ProviderType
     role: RoleType
@@ -70,6 +82,8 @@ class AgentConfig(BaseModel):
 class AgentResponse(BaseModel):
     """A single response from an agent during debate."""
 
+    model_config = ConfigDict(frozen=True)
+
     agent_id: UUID
     agent_name: str
     role: RoleType
@@ -77,6 +91,7 @@ class AgentResponse(BaseModel):
     content: str
     vote: VoteType | None = None
     reasoning: str | None = None  # Why they voted this way
+    confidence: float | None = None  # Self-reported vote confidence (0.0-1.0)
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
@@ -86,7 +101,7 @@ class AgentResponse(BaseModel):
 class CouncilConfig(BaseModel):
     """Configuration for a debate council."""
 
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=_new_id)
     name: str
     agents: list[AgentConfig]
     max_rounds: int = 5
@@ -120,7 +135,7 @@ class DebateRound(BaseModel):
 class Debate(BaseModel):
     """A complete debate session."""
 
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=_new_id)
     council_id: UUID
     topic: str
     status: DebateStatus = DebateStatus.PENDING
@@ -144,6 +159,8 @@ class DebateCreate(BaseModel):
 class DebateUpdate(BaseModel):
     """WebSocket message for debate updates."""
 
+    model_config = ConfigDict(frozen=True)
+
     debate_id: UUID
     event_type: str  # "round_start", "agent_thinking", "agent_response", "agent_response_chunk", "tool_call", "vote", "consensus", "summary"
     data: dict
@@ -170,13 +187,19 @@ def _load_prompt(filename: str) -> str:
 # Load stance directive (common to all roles except CUSTOM)
 STANCE_DIRECTIVE = "\n\n" + _load_prompt("stance_directive.txt")
 
-# Role-specific prompts loaded from individual files
-ROLE_PROMPTS: dict[RoleType, str] = {
-    RoleType.INVESTMENT_ADVISOR: _load_prompt("investment_advisor.txt") + STANCE_DIRECTIVE,
-    RoleType.PR_EXPERT: _load_prompt("pr_expert.txt") + STANCE_DIRECTIVE,
-    RoleType.POLITICS_EXPERT: _load_prompt("politics_expert.txt") + STANCE_DIRECTIVE,
-    RoleType.LEGAL_ADVISOR: _load_prompt("legal_advisor.txt") + STANCE_DIRECTIVE,
-    RoleType.TECH_STRATEGIST: _load_prompt("tech_strategist.txt") + STANCE_DIRECTIVE,
-    RoleType.DEVILS_ADVOCATE: _load_prompt("devils_advocate.txt") + STANCE_DIRECTIVE,
-    RoleType.CUSTOM: "",  # Will use custom_prompt from AgentConfig
-}
+# Role-specific prompts loaded from individual files. Exposed read-only so the
+# shared prompt strings can't be swapped out from under running debates.
+ROLE_PROMPTS: Mapping[RoleType, str] = MappingProxyType(
+    {
+        role: sys.intern(prompt)
+        for role, prompt in {
+            RoleType.INVESTMENT_ADVISOR: _load_prompt("investment_advisor.txt") + STANCE_DIRECTIVE,
+            RoleType.PR_EXPERT: _load_prompt("pr_expert.txt") + STANCE_DIRECTIVE,
+            RoleType.POLITICS_EXPERT: _load_prompt("politics_expert.txt") + STANCE_DIRECTIVE,
+            RoleType.LEGAL_ADVISOR: _load_prompt("legal_advisor.txt") + STANCE_DIRECTIVE,
+            RoleType.TECH_STRATEGIST: _load_prompt("tech_strategist.txt") + STANCE_DIRECTIVE,
+            RoleType.DEVILS_ADVOCATE: _load_prompt("devils_advocate.txt") + STANCE_DIRECTIVE,
+            RoleType.CUSTOM: "",  # Will use custom_prompt from AgentConfig
+        }.items()
+    }
+)
@@ -7,10 +7,14 @@ from pathlib import Path
 
 
 class OAuthAccountStore:
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path | None = None) -> None:
+        # Without a path, accounts are only kept in memory
         self._path = path
+        self._accounts: list[dict] = []
 
     def load_accounts(self) -> list[dict]:
+        if self._path is None:
+            return list(self._accounts)
         if not self._path.exists():
             return []
         with self._path.open("r", encoding="utf-8") as handle:
@@ -31,6 +35,9 @@ class OAuthAccountStore:
         return data
 
     def save_accounts(self, accounts: list[dict]) -> None:
+        if self._path is None:
+            self._accounts = list(accounts)
+            return
         self._path.parent.mkdir(parents=True, exist_ok=True)
         with tempfile.NamedTemporaryFile(
             "w",
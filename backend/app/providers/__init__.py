@@ -3,7 +3,6 @@ AgentsCouncil Backend - Provider Registry
 """
 
 from pathlib import Path
-from typing import Optional
 
 from app.config import get_settings
 from app.models import ProviderType
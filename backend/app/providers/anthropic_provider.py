@@ -4,8 +4,6 @@ AgentsCouncil Backend - Anthropic Provider
 
 from collections.abc import AsyncIterator
 
-import anthropic
-
 from app.providers.base import BaseProvider
 
 
@@ -14,6 +12,9 @@ class AnthropicProvider(BaseProvider):
 
     def __init__(self, api_key: str):
         super().__init__(api_key)
+        # Imported on first use so loading the registry doesn't pull in the SDK
+        import anthropic
+
         self.client = anthropic.AsyncAnthropic(api_key=api_key)
 
     @property
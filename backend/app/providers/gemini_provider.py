@@ -22,9 +22,9 @@ class GeminiProvider(BaseProvider):
     BASE_DELAY = 10.0  # seconds - start with 10s for quota limits
     MAX_DELAY = 60.0  # seconds - up to 60s as API suggests
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, client: genai.Client | None = None):
         super().__init__(api_key)
-        self.client = genai.Client(api_key=api_key)
+        self.client = client or genai.Client(api_key=api_key)
 
     @property
     def name(self) -> str:
@@ -166,6 +166,28 @@ class GeminiProvider(BaseProvider):
         tool_calls_made = []
         contents = [user_message]
 
+        async def _execute_tool_call(fc: types.FunctionCall) -> tuple[dict, types.Part]:
+            tool_name = fc.name
+            tool_args = dict(fc.args) if fc.args else {}
+
+            logger.info(f"Executing tool: {tool_name} with args: {tool_args}")
+
+            try:
+                result = await ToolRegistry.execute_tool(tool_name, tool_args)
+            except Exception as e:
+                logger.error(f"Tool execution failed: {e}")
+                call = {"name": tool_name, "args": tool_args, "result": f"Error: {str(e)}"}
+                return call, types.Part.from_function_response(
+                    name=tool_name,
+                    response={"error": str(e)},
+                )
+
+            call = {"name": tool_name, "args": tool_args, "result": result}
+            return call, types.Part.from_function_response(
+                name=tool_name,
+                response={"result": str(result)},
+            )
+
         async def _do_generate_with_tools():
             nonlocal contents, tool_calls_made
 
@@ -200,47 +222,14 @@ class GeminiProvider(BaseProvider):
                     # No function calls, we have the final response
                     break
 
-                # Execute each function call
+                # Tools are independent, so run every call from this turn at once
+                results = await asyncio.gather(
+                    *(_execute_tool_call(part.function_call) for part in function_calls)
+                )
                 function_responses = []
-                for part in function_calls:
-                    fc = part.function_call
-                    tool_name = fc.name
-                    tool_args = dict(fc.args) if fc.args else {}
-
-                    logger.info(f"Executing tool: {tool_name} with args: {tool_args}")
-
-                    try:
-                        result = await ToolRegistry.execute_tool(tool_name, tool_args)
-                        tool_calls_made.append(
-                            {
-                                "name": tool_name,
-                                "args": tool_args,
-                                "result": result,
-                            }
-                        )
-
-                        # Create function response
-                        function_responses.append(
-                            types.Part.from_function_response(
-                                name=tool_name,
-                                response={"result": str(result)},
-                            )
-                        )
-                    except Exception as e:
-                        logger.error(f"Tool execution failed: {e}")
-                        tool_calls_made.append(
-                            {
-                                "name": tool_name,
-                                "args": tool_args,
-                                "result": f"Error: {str(e)}",
-                            }
-                        )
-                        function_responses.append(
-                            types.Part.from_function_response(
-                                name=tool_name,
-                                response={"error": str(e)},
-                            )
-                        )
+                for call, function_response in results:
+                    tool_calls_made.append(call)
+                    function_responses.append(function_response)
 
                 # Send function results back to the model
                 response = await self.client.aio.models.generate_content(
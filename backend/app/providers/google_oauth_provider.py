@@ -25,6 +25,9 @@ class GoogleOAuthProvider(BaseProvider):
             "/"
         )
         self.client = client or httpx.AsyncClient(base_url=self.base_url, timeout=120.0)
+        # Most calls use the default model, so build its endpoint paths once
+        self._generate_path = f"/models/{self.default_model}:generateContent"
+        self._stream_path = f"/models/{self.default_model}:streamGenerateContent"
 
     @property
     def name(self) -> str:
@@ -43,11 +46,8 @@ class GoogleOAuthProvider(BaseProvider):
     ) -> str:
         token = await self.token_getter()
         payload = self._build_payload(system_prompt, user_message, max_tokens)
-        response = await self._post(
-            f"/models/{model or self.default_model}:generateContent",
-            token,
-            payload,
-        )
+        path = f"/models/{model}:generateContent" if model else self._generate_path
+        response = await self._post(path, token, payload)
         return response.get("content", "")
 
     async def generate_stream(
@@ -59,11 +59,8 @@ class GoogleOAuthProvider(BaseProvider):
     ) -> AsyncIterator[str]:
         token = await self.token_getter()
         payload = self._build_payload(system_prompt, user_message, max_tokens)
-        async for chunk in self._stream(
-            f"/models/{model or self.default_model}:streamGenerateContent",
-            token,
-            payload,
-        ):
+        path = f"/models/{model}:streamGenerateContent" if model else self._stream_path
+        async for chunk in self._stream(path, token, payload):
             yield chunk
 
     async def list_models(self) -> list[str]:
@@ -4,8 +4,6 @@ AgentsCouncil Backend - OpenAI Provider
 
 from collections.abc import AsyncIterator
 
-from openai import AsyncOpenAI
-
 from app.providers.base import BaseProvider
 
 
@@ -14,7 +12,10 @@ class OpenAIProvider(BaseProvider):
 
     def __init__(self, api_key: str):
         super().__init__(api_key)
-        self.client = AsyncOpenAI(api_key=api_key)
+        # Imported on first use so loading the registry doesn't pull in the SDK
+        import openai
+
+        self.client = openai.AsyncOpenAI(api_key=api_key)
 
     @property
     def name(self) -> str:
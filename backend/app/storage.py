@@ -1,5 +1,8 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import ClassVar
 from uuid import UUID
 
 import aiosqlite
@@ -26,11 +29,46 @@ class Storage:
 
     _db_path: Path | None = None
     _initialized: bool = False
+    # synchronous=NORMAL skips most fsyncs; under WAL a power loss can drop the last
+    # commits but never corrupts the file, which is fine for the test suite
+    _fast: bool = False
+    # Idle connections kept open between calls so each call skips connect() and
+    # finds SQLite's page cache warm
+    _pool: ClassVar[list[aiosqlite.Connection]] = []
+    _pool_size: int = 4
 
     @classmethod
-    def configure(cls, db_path: Path) -> None:
+    def configure(cls, db_path: Path, fast: bool = False) -> None:
         cls._db_path = db_path
         cls._initialized = False
+        cls._fast = fast
+
+    @classmethod
+    @asynccontextmanager
+    async def _connect(cls) -> AsyncIterator[aiosqlite.Connection]:
+        db_path = cls._db_path
+        if cls._pool:
+            connection = cls._pool.pop()
+        else:
+            connection = await aiosqlite.connect(db_path)
+            if cls._fast:
+                await connection.execute("PRAGMA synchronous=NORMAL;")
+        try:
+            yield connection
+        finally:
+            if connection.in_transaction:
+                await connection.rollback()
+            connection.row_factory = None
+            if db_path == cls._db_path and len(cls._pool) < cls._pool_size:
+                cls._pool.append(connection)
+            else:
+                await connection.close()
+
+    @classmethod
+    async def close(cls) -> None:
+        pool, cls._pool = cls._pool, []
+        for connection in pool:
+            await connection.close()
 
     @classmethod
     async def initialize(cls) -> None:
@@ -41,6 +79,8 @@ class Storage:
     async def _ensure_initialized(cls) -> None:
         if cls._initialized:
             return
+        # configure() may have switched databases since these were opened
+        await cls.close()
         if cls._db_path is None:
             cls._db_path = DEFAULT_DB_PATH
         await db.init_db(cls._db_path)
@@ -49,7 +89,7 @@ class Storage:
     @classmethod
     async def _mark_stuck_debates_error(cls) -> None:
         await cls._ensure_initialized()
-        async with aiosqlite.connect(cls._db_path) as connection:
+        async with cls._connect() as connection:
             await connection.execute(
                 """
                 UPDATE debates
@@ -67,7 +107,7 @@ class Storage:
     @classmethod
     async def save_council(cls, council: CouncilConfig) -> CouncilConfig:
         await cls._ensure_initialized()
-        async with aiosqlite.connect(cls._db_path) as connection:
+        async with cls._connect() as connection:
             await connection.execute(
                 """
                 INSERT INTO councils (id, name, max_rounds, consensus_threshold, created_at)
@@ -92,21 +132,21 @@ class Storage:
                 (str(council.id),),
             )
 
-            for index, agent in enumerate(council.agents):
-                await connection.execute(
-                    """
-                    INSERT INTO council_agents (
-                        id,
-                        council_id,
-                        name,
-                        provider,
-                        role,
-                        custom_prompt,
-                        model,
-                        sort_order
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            await connection.executemany(
+                """
+                INSERT INTO council_agents (
+                    id,
+                    council_id,
+                    name,
+                    provider,
+                    role,
+                    custom_prompt,
+                    model,
+                    sort_order
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         str(agent.id),
                         str(council.id),
@@ -116,8 +156,10 @@ class Storage:
                         agent.custom_prompt,
                         agent.model,
                         index,
-                    ),
-                )
+                    )
+                    for index, agent in enumerate(council.agents)
+                ],
+            )
 
             await connection.commit()
         return council
@@ -125,7 +167,7 @@ class Storage:
     @classmethod
     async def get_council(cls, council_id: UUID) -> CouncilConfig | None:
         await cls._ensure_initialized()
-        async with aiosqlite.connect(cls._db_path) as connection:
+        async with cls._connect() as connection:
             connection.row_factory = aiosqlite.Row
             cursor = await connection.execute(
                 "SELECT * FROM councils WHERE id = ?",
@@ -168,7 +210,7 @@ class Storage:
     @classmethod
     async def list_councils(cls) -> list[CouncilConfig]:
         await cls._ensure_initialized()
-        async with aiosqlite.connect(cls._db_path) as connection:
+        async with cls._connect() as connection:
             connection.row_factory = aiosqlite.Row
             cursor = await connection.execute("SELECT * FROM councils ORDER BY created_at ASC")
             council_rows = await cursor.fetchall()
@@ -212,7 +254,7 @@ class Storage:
     @classmethod
     async def delete_council(cls, council_id: UUID) -> bool:
         await cls._ensure_initialized()
-        async with aiosqlite.connect(cls._db_path) as connection:
+        async with cls._connect() as connection:
             cursor = await connection.execute(
                 "DELETE FROM councils WHERE id = ?",
                 (str(council_id),),
@@ -223,7 +265,7 @@ class Storage:
     @classmethod
     async def save_debate(cls, debate: Debate) -> Debate:
         await cls._ensure_initialized()
-        async with aiosqlite.connect(cls._db_path) as connection:
+        async with cls._connect() as connection:
             await connection.execute(
                 """
                 INSERT INTO debates (
@@ -317,9 +359,10 @@ class Storage:
                             content,
                             vote,
                             reasoning,
+                            confidence,
                             timestamp
                         )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                         """,
                         (
                             str(debate.id),
@@ -331,6 +374,7 @@ class Storage:
                             response.content,
                             response.vote.value if response.vote else None,
                             response.reasoning,
+                            response.confidence,
                             response.timestamp.isoformat(),
                         ),
                     )
@@ -378,7 +422,7 @@ class Storage:
     @classmethod
     async def get_debate(cls, debate_id: UUID) -> Debate | None:
         await cls._ensure_initialized()
-        async with aiosqlite.connect(cls._db_path) as connection:
+        async with cls._connect() as connection:
             connection.row_factory = aiosqlite.Row
             cursor = await connection.execute(
                 "SELECT * FROM debates WHERE id = ?",
@@ -418,6 +462,7 @@ class Storage:
                         content=row["content"],
                         vote=row["vote"],
                         reasoning=row["reasoning"],
+                        confidence=row["confidence"],
                         timestamp=row["timestamp"],
                     )
                     for row in response_rows
@@ -492,7 +537,7 @@ class Storage:
     @classmethod
     async def delete_debate(cls, debate_id: UUID) -> bool:
         await cls._ensure_initialized()
-        async with aiosqlite.connect(cls._db_path) as connection:
+        async with cls._connect() as connection:
             cursor = await connection.execute(
                 "DELETE FROM debates WHERE id = ?",
                 (str(debate_id),),
@@ -503,7 +548,7 @@ class Storage:
     @classmethod
     async def list_debates(cls, council_id: UUID | None = None) -> list[Debate]:
         await cls._ensure_initialized()
-        async with aiosqlite.connect(cls._db_path) as connection:
+        async with cls._connect() as connection:
             connection.row_factory = aiosqlite.Row
             if council_id:
                 cursor = await connection.execute(
@@ -524,7 +569,7 @@ class Storage:
     @classmethod
     async def clear(cls) -> None:
         await cls._ensure_initialized()
-        async with aiosqlite.connect(cls._db_path) as connection:
+        async with cls._connect() as connection:
             await connection.execute("DELETE FROM debate_points")
             await connection.execute("DELETE FROM debate_votes")
             await connection.execute("DELETE FROM debate_responses")
@@ -3,6 +3,7 @@ AgentsCouncil Backend - Tool Registry
 
 Defines tools available to agents and their schemas for function calling.
 """
+from functools import cache
 from typing import Any, Callable, Coroutine
 
 from google.genai import types
@@ -57,9 +58,16 @@ class ToolRegistry:
         ),
     ]
 
+    # Each declared tool is implemented by the StockTools method of the same name
+    TOOL_NAMES = frozenset(declaration.name for declaration in TOOL_DECLARATIONS)
+
     @classmethod
+    @cache
     def get_gemini_tools(cls) -> list[types.Tool]:
-        """Get tools in Gemini format."""
+        """Get tools in Gemini format.
+
+        The list is built once and shared by every caller, so treat it as read-only.
+        """
         return [types.Tool(function_declarations=cls.TOOL_DECLARATIONS)]
 
     @classmethod
@@ -73,18 +81,10 @@ class ToolRegistry:
         Returns:
             Tool execution result
         """
-        tools = get_stock_tools()
-        
-        handlers: dict[str, ToolFunction] = {
-            "get_stock_quote": tools.get_stock_quote,
-            "get_stock_news": tools.get_stock_news,
-            "get_market_summary": tools.get_market_summary,
-        }
-        
-        handler = handlers.get(name)
-        if not handler:
+        if name not in cls.TOOL_NAMES:
             raise ValueError(f"Unknown tool: {name}")
-        
+
+        handler: ToolFunction = getattr(get_stock_tools(), name)
         return await handler(**args)
 
 
@@ -4,6 +4,7 @@ AgentsCouncil Backend - Stock Market Tools
 Provides stock quote, news, and market data tools for the investment agent.
 Uses yfinance for stock data and langchain-community for tool abstractions.
 """
+import asyncio
 import logging
 from typing import Any
 
@@ -28,6 +29,10 @@ class StockTools:
         Returns:
             Dict with price, change, volume, market cap, and other metrics
         """
+        # yfinance blocks on network I/O, so run it off the event loop
+        return await asyncio.to_thread(self._fetch_stock_quote, symbol)
+
+    def _fetch_stock_quote(self, symbol: str) -> dict[str, Any]:
         try:
             ticker = yf.Ticker(symbol.upper())
             info = ticker.info
@@ -67,7 +72,7 @@ class StockTools:
         """
         try:
             # Use LangChain's Yahoo Finance News tool
-            result = self._news_tool.invoke(symbol.upper())
+            result = await asyncio.to_thread(self._news_tool.invoke, symbol.upper())
             return result
         except Exception as e:
             logger.error(f"Error fetching news for {symbol}: {e}")
@@ -79,6 +84,9 @@ class StockTools:
         Returns:
             Dict with S&P 500, NASDAQ, and DOW data
         """
+        return await asyncio.to_thread(self._fetch_market_summary)
+
+    def _fetch_market_summary(self) -> dict[str, Any]:
         indices = {
             "sp500": "^GSPC",
             "nasdaq": "^IXIC",
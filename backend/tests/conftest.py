@@ -2,11 +2,13 @@
 Pytest Configuration and Shared Fixtures
 """
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, NonCallableMagicMock
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
 from app.models import (
     AgentConfig,
     CouncilConfig,
@@ -17,19 +19,47 @@ from app.models import (
     RoleType,
     VoteType,
 )
+from app.oauth_accounts import OAuthAccountStore
+from app.oauth_server import OAuthServer, get_oauth_server
 from app.storage import Storage
 
 
-@pytest_asyncio.fixture(autouse=True)
-async def clear_storage(tmp_path):
-    """Clear storage before and after each test."""
-    Storage.configure(tmp_path / "agentscouncil.db")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def storage_db(tmp_path_factory):
+    """Create and initialize one SQLite database for the whole session."""
+    db_path = tmp_path_factory.mktemp("storage") / "agentscouncil.db"
+    Storage.configure(db_path, fast=True)
     await Storage.initialize()
-    await Storage.clear()
+    yield db_path
+    await Storage.close()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_storage(storage_db):
+    """Empty the session database after each test."""
     yield
+    # Tests that configure their own database leave Storage pointing at it
+    if Storage._db_path != storage_db:
+        Storage.configure(storage_db, fast=True)
     await Storage.clear()
 
 
+@pytest.fixture(scope="session")
+def app():
+    """Import the FastAPI app only once a test that needs it runs."""
+    from app.main import app as fastapi_app
+
+    return fastapi_app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(app):
+    """Create an async test client shared by every API test."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
 @pytest.fixture
 def sample_agent_openai() -> AgentConfig:
     """Create a sample OpenAI agent."""
@@ -121,10 +151,36 @@ def completed_debate(sample_council) -> Debate:
 @pytest.fixture
 def mock_provider():
     """Create a mock AI provider."""
-    provider = MagicMock()
+    provider = NonCallableMagicMock()
     provider.name = "mock"
     provider.default_model = "mock-model"
     provider.generate = AsyncMock(return_value="This is a mock response from the AI.")
     provider.get_system_prompt = MagicMock(return_value="You are a test assistant.")
     return provider
 
+
+@pytest.fixture
+def oauth_account_store() -> OAuthAccountStore:
+    """Create an in-memory OAuth account store."""
+    return OAuthAccountStore()
+
+
+@pytest.fixture
+def oauth_http_client() -> AsyncClient | None:
+    """HTTP client for the test OAuthServer; override to mock Google's endpoints."""
+    return None
+
+
+@pytest_asyncio.fixture
+async def oauth_server(app, oauth_account_store, oauth_http_client, monkeypatch):
+    """Serve a test OAuthServer to the OAuth endpoints for the duration of one test."""
+    server = OAuthServer(
+        client_id="client",
+        client_secret="secret",
+        redirect_uri="http://localhost/api/providers/google-oauth/callback",
+        account_store=oauth_account_store,
+        http_client=oauth_http_client,
+    )
+    monkeypatch.setitem(app.dependency_overrides, get_oauth_server, lambda: server)
+    yield server
+    await server.close()
@@ -2,34 +2,21 @@
 Tests for FastAPI REST Endpoints
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, NonCallableMagicMock, patch
 from uuid import uuid4
 
-import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
-
-from app.main import app
+from app.api.websocket import broadcast_debate_update, manager
 from app.models import (
     AgentConfig,
     CouncilConfig,
     DebateStatus,
+    DebateUpdate,
     ProviderType,
     RoleType,
 )
 from app.providers import ProviderRegistry
 from app.storage import Storage
 
-pytestmark = pytest.mark.asyncio
-
-
-@pytest_asyncio.fixture
-async def client():
-    """Create an async test client."""
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
-
 
 class TestRootEndpoint:
     """Tests for the root endpoint."""
@@ -275,7 +262,7 @@ class TestProvidersAPI:
 
     async def test_list_provider_models(self, client):
         """Test listing models for a provider."""
-        mock_provider = MagicMock()
+        mock_provider = NonCallableMagicMock()
         mock_provider.list_models = AsyncMock(return_value=["model1", "model2"])
 
         with (
@@ -288,3 +275,26 @@ class TestProvidersAPI:
             assert "models" in data
             models = data["models"]
             assert "model1" in models
+
+
+class TestDebateWebSocket:
+    """Tests for debate WebSocket broadcasts."""
+
+    async def test_broadcast_debate_update_frame(self, monkeypatch):
+        """Test subscribers receive the update's event type and data as one JSON frame."""
+        debate_id = uuid4()
+        websocket = NonCallableMagicMock()
+        websocket.send_text = AsyncMock()
+        monkeypatch.setitem(manager.active_connections, debate_id, [websocket])
+
+        await broadcast_debate_update(
+            DebateUpdate(
+                debate_id=debate_id,
+                event_type="agent_response_chunk",
+                data={"round": 1, "chunk": "Hello"},
+            )
+        )
+
+        websocket.send_text.assert_awaited_once_with(
+            '{"event_type":"agent_response_chunk","data":{"round":1,"chunk":"Hello"}}'
+        )
@@ -2,12 +2,13 @@
 Tests for Debate Engine
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, NonCallableMagicMock, patch
 from uuid import uuid4
 
 import pytest
 
-from app.core.debate_engine import DebateEngine
+from app.core.debate_engine import _CHUNK_FLUSH_INTERVAL, DebateEngine
 from app.models import (
     AgentConfig,
     AgentResponse,
@@ -52,7 +53,6 @@ class TestDebateEngineEvents:
 
         assert callback in engine._event_callbacks
 
-    @pytest.mark.asyncio
     async def test_emit_event_calls_callbacks(self, sample_council):
         """Test that emitting events calls all registered callbacks."""
         engine = DebateEngine(sample_council, "Test topic")
@@ -67,7 +67,103 @@ class TestDebateEngineEvents:
         assert callback1.call_count == 1
         assert callback2.call_count == 1
 
-    @pytest.mark.asyncio
+    async def test_stream_chunks_are_coalesced(self, sample_council, mock_provider):
+        """Test that rapid stream chunks are batched into fewer chunk events."""
+        chunks = [f"part{i} " for i in range(10)]
+
+        async def fake_stream(**_kwargs):
+            for chunk in chunks:
+                yield chunk
+
+        mock_provider.generate_stream = fake_stream
+
+        with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
+            mock_registry.get.return_value = mock_provider
+            engine = DebateEngine(sample_council, "Test topic")
+
+            events = []
+            engine.on_event(lambda e: events.append(e))
+
+            response = await engine._stream_and_collect_response(
+                sample_council.agents[1], "context", 1
+            )
+
+        chunk_events = [e for e in events if e.event_type == "agent_response_chunk"]
+        assert 0 < len(chunk_events) < len(chunks)
+        assert "".join(e.data["chunk"] for e in chunk_events) == "".join(chunks)
+        assert chunk_events[-1].data["full_content_so_far"] == response.content
+
+    async def test_stalled_stream_flushes_buffered_chunk(self, sample_council, mock_provider):
+        """Test that a chunk buffered before a stall is emitted within the flush interval."""
+        stalled = asyncio.Event()
+        resume = asyncio.Event()
+
+        async def fake_stream(**_kwargs):
+            yield "first "
+            yield "second "
+            stalled.set()
+            await resume.wait()
+            yield "third"
+
+        mock_provider.generate_stream = fake_stream
+
+        with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
+            mock_registry.get.return_value = mock_provider
+            engine = DebateEngine(sample_council, "Test topic")
+
+            chunks: list[str] = []
+            engine.on_event(lambda e: chunks.append(e.data.get("chunk", "")))
+
+            task = asyncio.create_task(
+                engine._stream_and_collect_response(sample_council.agents[1], "context", 1)
+            )
+            await stalled.wait()
+            await asyncio.sleep(_CHUNK_FLUSH_INTERVAL * 4)
+            flushed_during_stall = "".join(chunks)
+            resume.set()
+            response = await task
+
+        assert flushed_during_stall == "first second "
+        assert response.content == "first second third"
+
+    async def test_cancelled_stream_is_closed(self, sample_council, mock_provider):
+        """Test that cancelling a response mid-stream closes the provider's stream."""
+        stalled = asyncio.Event()
+        closed = asyncio.Event()
+
+        async def fake_stream(**_kwargs):
+            try:
+                yield "first "
+                stalled.set()
+                await asyncio.Event().wait()
+            finally:
+                closed.set()
+
+        mock_provider.generate_stream = fake_stream
+
+        with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
+            mock_registry.get.return_value = mock_provider
+            engine = DebateEngine(sample_council, "Test topic")
+
+            task = asyncio.create_task(
+                engine._stream_and_collect_response(sample_council.agents[1], "context", 1)
+            )
+            await stalled.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert closed.is_set()
+
+    async def test_emit_event_without_callbacks_builds_nothing(self, sample_council):
+        """Test that emitting with no subscribers skips building the update."""
+        engine = DebateEngine(sample_council, "Test topic")
+
+        with patch("app.core.debate_engine.DebateUpdate") as mock_update:
+            await engine._emit_event("test_event", {"key": "value"})
+
+        mock_update.assert_not_called()
+
     async def test_emit_event_with_async_callback(self, sample_council):
         """Test emitting events with async callbacks."""
         engine = DebateEngine(sample_council, "Test topic")
@@ -132,6 +228,60 @@ class TestDebateEngineVoting:
 
         assert engine._check_consensus(vote_summary) is False
 
+    def test_calculate_weighted_summary(self, sample_council):
+        """Test weighting votes by confidence, defaulting missing confidences."""
+        engine = DebateEngine(sample_council, "Test topic")
+
+        votes = {
+            "agent1": VoteType.AGREE,
+            "agent2": VoteType.AGREE,
+            "agent3": VoteType.DISAGREE,
+        }
+
+        summary = engine._calculate_weighted_summary(votes, {"agent1": 0.9, "agent3": 0.2})
+
+        assert summary["agree"] == pytest.approx(1.4)
+        assert summary["disagree"] == pytest.approx(0.2)
+        assert summary["abstain"] == 0.0
+
+    def test_check_consensus_reached_by_confidence(self, sample_council):
+        """Test a confident majority reaches consensus that raw counts do not."""
+        engine = DebateEngine(sample_council, "Test topic")
+
+        vote_summary = {"agree": 2, "disagree": 1, "abstain": 0}
+        weighted_summary = {"agree": 1.8, "disagree": 0.1, "abstain": 0.0}
+
+        assert engine._check_consensus(vote_summary) is False
+        assert engine._check_consensus(vote_summary, weighted_summary) is True
+
+    def test_check_consensus_zero_confidence_uses_counts(self, sample_council):
+        """Test unanimous votes reported with zero confidence still reach consensus."""
+        engine = DebateEngine(sample_council, "Test topic")
+
+        vote_summary = {"agree": 3, "disagree": 0, "abstain": 0}
+        weighted_summary = {"agree": 0.0, "disagree": 0.0, "abstain": 0.0}
+
+        assert engine._check_consensus(vote_summary, weighted_summary) is True
+
+    def test_check_consensus_confident_minority_not_reached(self, sample_council):
+        """Test a single confident agree cannot outweigh a disagreeing majority."""
+        engine = DebateEngine(sample_council, "Test topic")
+        engine.council.consensus_threshold = 0.67
+
+        vote_summary = {"agree": 1, "disagree": 2, "abstain": 0}
+        weighted_summary = {"agree": 1.0, "disagree": 0.4, "abstain": 0.0}
+
+        assert engine._check_consensus(vote_summary, weighted_summary) is False
+
+    def test_check_consensus_count_split_at_half_threshold(self, sample_council):
+        """Test an even count-only split still meets a 0.5 threshold."""
+        engine = DebateEngine(sample_council, "Test topic")
+        engine.council.consensus_threshold = 0.5
+
+        vote_summary = {"agree": 2, "disagree": 2, "abstain": 0}
+
+        assert engine._check_consensus(vote_summary) is True
+
     def test_check_consensus_empty_votes(self, sample_council):
         """Test consensus calculation with no votes."""
         engine = DebateEngine(sample_council, "Test topic")
@@ -179,11 +329,35 @@ class TestDebateEngineContext:
         assert "Agent 1" in context
         assert "This is agent 1's response" in context
 
+    def test_build_round_context_includes_rounds_added_later(self, sample_council):
+        """Test context built after a new round includes both old and new rounds."""
+        engine = DebateEngine(sample_council, "Test topic")
+
+        for round_number in (1, 2):
+            engine.debate.rounds.append(
+                DebateRound(
+                    round_number=round_number,
+                    responses=[
+                        AgentResponse(
+                            agent_id=uuid4(),
+                            agent_name=f"Agent {round_number}",
+                            role=RoleType.TECH_STRATEGIST,
+                            provider=ProviderType.GEMINI,
+                            content=f"Response in round {round_number}.",
+                        )
+                    ],
+                )
+            )
+            context = engine._build_round_context(round_number + 1)
+
+        assert context.index("Round 1") < context.index("Round 2")
+        assert "Response in round 1." in context
+        assert "Response in round 2." in context
+
 
 class TestDebateEngineRun:
     """Tests for running debates with mocked providers."""
 
-    @pytest.mark.asyncio
     async def test_run_debate_with_mocked_provider(self, sample_council, mock_provider):
         """Test running a complete debate with mocked provider."""
         with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
@@ -216,7 +390,6 @@ class TestDebateEngineRun:
                 ]
                 assert len(result.rounds) > 0
 
-    @pytest.mark.asyncio
     async def test_run_round_collects_responses(self, sample_council, mock_provider):
         """Test that running a round collects all agent responses."""
         with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
@@ -235,10 +408,10 @@ class TestDebateEngineRun:
 
             round_result = await engine._run_round(1)
 
-            # Should have responses from both agents
+            # Should have responses from both agents, each carrying its vote
             assert len(round_result.responses) == 2
+            assert all(resp.vote is not None for resp in round_result.responses)
 
-    @pytest.mark.asyncio
     async def test_get_agent_response_error_handling(self, sample_council):
         """Test error handling when provider is unavailable."""
         with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
@@ -250,11 +423,37 @@ class TestDebateEngineRun:
             with pytest.raises(ValueError, match="not available"):
                 await engine._stream_and_collect_response(agent, "context", 1)
 
+    async def test_providers_resolved_once_per_agent(self, sample_council, mock_provider):
+        """Test that providers are looked up at init, not per response or vote."""
+        with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
+            mock_registry.get.return_value = mock_provider
+
+            engine = DebateEngine(sample_council, "Test topic")
+            assert mock_registry.get.call_count == len(sample_council.agents)
+
+            mock_provider.generate = AsyncMock(return_value="VOTE: AGREE\nREASONING: Fine.")
+            await engine._get_agent_vote(sample_council.agents[0], [])
+            await engine._get_agent_vote(sample_council.agents[0], [])
+
+            assert mock_registry.get.call_count == len(sample_council.agents)
+
+    async def test_system_prompt_built_once_per_agent(self, sample_council, mock_provider):
+        """Test that an agent's system prompt is reused across rounds."""
+        with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
+            mock_registry.get.return_value = mock_provider
+
+            engine = DebateEngine(sample_council, "Test topic")
+            agent = sample_council.agents[0]
+
+            await engine._stream_and_collect_response(agent, "context", 1)
+            await engine._stream_and_collect_response(agent, "context", 2)
+
+            mock_provider.get_system_prompt.assert_called_once_with(agent)
+
 
 class TestVoteParsingLogic:
     """Tests for vote parsing from AI responses."""
 
-    @pytest.mark.asyncio
     async def test_parse_agree_vote(self, sample_council, mock_provider):
         """Test parsing AGREE vote from response."""
         with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
@@ -279,12 +478,42 @@ class TestVoteParsingLogic:
 
             assert result.vote == VoteType.AGREE
             assert "fully support" in result.reasoning
+            assert result.confidence == 0.5  # Default when not reported
+
+    async def test_parse_vote_confidence(self, sample_council, mock_provider):
+        """Test parsing the reported vote confidence, including percentages."""
+        with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
+            mock_registry.get.return_value = mock_provider
+            engine = DebateEngine(sample_council, "Test topic")
+            agent = sample_council.agents[0]
+
+            for text, expected in [
+                ("VOTE: AGREE\nCONFIDENCE: 0.9\nREASONING: Sure.", 0.9),
+                ("VOTE: AGREE\nConfidence: [0.25]\nREASONING: Maybe.", 0.25),
+                ("VOTE: AGREE\nCONFIDENCE: 85\nREASONING: Very sure.", 0.85),
+                ("VOTE: AGREE\nCONFIDENCE: 250\nREASONING: Certain.", 0.5),
+            ]:
+                mock_provider.generate = AsyncMock(return_value=text)
+                result = await engine._get_agent_vote(agent, [])
+                assert result.confidence == pytest.approx(expected)
+
+    async def test_parse_vote_confidence_ignores_reasoning(self, sample_council, mock_provider):
+        """Test a confidence mentioned inside the reasoning is not read as the vote's."""
+        with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
+            mock_registry.get.return_value = mock_provider
+            engine = DebateEngine(sample_council, "Test topic")
+            mock_provider.generate = AsyncMock(
+                return_value="VOTE: AGREE\nREASONING: Analysts put confidence: 0.9 on it."
+            )
+
+            result = await engine._get_agent_vote(sample_council.agents[0], [])
+
+            assert result.confidence == 0.5
 
-    @pytest.mark.asyncio
     async def test_parse_disagree_vote(self, sample_council):
         """Test parsing DISAGREE vote from response."""
         # Create a fresh mock to avoid any state issues
-        fresh_mock_provider = MagicMock()
+        fresh_mock_provider = NonCallableMagicMock()
         fresh_mock_provider.generate = AsyncMock(
             return_value="VOTE: DISAGREE\nREASONING: I have concerns."
         )
@@ -301,7 +530,22 @@ class TestVoteParsingLogic:
 
             assert result.vote == VoteType.DISAGREE
 
-    @pytest.mark.asyncio
+    async def test_parse_decorated_votes(self, sample_council, mock_provider):
+        """Test parsing votes wrapped in brackets or markdown."""
+        with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
+            mock_registry.get.return_value = mock_provider
+            engine = DebateEngine(sample_council, "Test topic")
+            agent = sample_council.agents[0]
+
+            for text, expected in [
+                ("VOTE: [DISAGREE]\nREASONING: No.", VoteType.DISAGREE),
+                ("VOTE: **Agree**\nREASONING: Yes.", VoteType.AGREE),
+                ("VOTE: [ABSTAIN]\nREASONING: Unsure.", VoteType.ABSTAIN),
+            ]:
+                mock_provider.generate = AsyncMock(return_value=text)
+                result = await engine._get_agent_vote(agent, [])
+                assert result.vote == expected
+
     async def test_parse_abstain_default(self, sample_council, mock_provider):
         """Test that unparseable votes default to ABSTAIN."""
         with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
@@ -320,7 +564,6 @@ class TestVoteParsingLogic:
 class TestDebateEngineToolCallEvents:
     """Tests for tool call event handling in the debate engine."""
 
-    @pytest.mark.asyncio
     async def test_tool_call_event_emitted(self, sample_council, mock_provider):
         """Test that tool_call events are emitted during debate."""
         with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
@@ -368,7 +611,6 @@ class TestDebateEngineToolCallEvents:
                 assert "tool_result" in event.data
                 assert event.data["tool_name"] == "get_stock_quote"
 
-    @pytest.mark.asyncio
     async def test_tool_call_event_with_investment_advisor(self, sample_council):
         """Test that investment advisor triggers tool calls."""
         investment_agent = AgentConfig(
@@ -385,7 +627,7 @@ class TestDebateEngineToolCallEvents:
             consensus_threshold=0.8,
         )
 
-        mock_gemini = MagicMock()
+        mock_gemini = NonCallableMagicMock()
         mock_gemini.name = "gemini"
         mock_gemini.default_model = "gemini-1.5-flash"
         mock_gemini.generate_with_tools = AsyncMock(
@@ -417,7 +659,6 @@ class TestDebateEngineToolCallEvents:
             assert len(tool_events) > 0
             assert any("market" in str(e.data).lower() for e in tool_events)
 
-    @pytest.mark.asyncio
     async def test_multiple_tool_calls_in_single_response(self, sample_council, mock_provider):
         """Test handling of multiple tool calls in a single response."""
         with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
@@ -466,7 +707,6 @@ class TestDebateEngineToolCallEvents:
             tool_call_events = [e for e in events if e.event_type == "tool_call"]
             assert len(tool_call_events) == 3
 
-    @pytest.mark.asyncio
     async def test_tool_call_truncation_for_ui(self, sample_council, mock_provider):
         """Test that tool results are truncated for UI display."""
         with patch("app.core.debate_engine.ProviderRegistry") as mock_registry:
@@ -509,10 +749,9 @@ class TestDebateEngineToolCallEvents:
 class TestDebateEngineErrorHandling:
     """Tests for error handling in debate engine."""
 
-    @pytest.mark.asyncio
     async def test_provider_error_handling(self, sample_council):
         """Test that provider errors are handled gracefully."""
-        mock_failing = MagicMock()
+        mock_failing = NonCallableMagicMock()
         mock_failing.generate = AsyncMock(side_effect=Exception("API rate limit"))
         mock_failing.get_system_prompt = MagicMock(return_value="You are a test assistant.")
 
@@ -528,12 +767,11 @@ class TestDebateEngineErrorHandling:
             assert response.content == ""
             assert response.provider == agent.provider
 
-    @pytest.mark.asyncio
     async def test_debate_timeout_handling(self, sample_council):
         """Test that timeout errors are handled gracefully."""
         import asyncio
 
-        mock_provider = MagicMock()
+        mock_provider = NonCallableMagicMock()
         mock_provider.generate = AsyncMock(side_effect=asyncio.TimeoutError())
         mock_provider.get_system_prompt = MagicMock(return_value="You are a test assistant.")
 
@@ -4,12 +4,9 @@ Tests for Google OAuth provider.
 
 from unittest.mock import ANY, AsyncMock
 
-import pytest
-
 from app.providers.google_oauth_provider import GoogleOAuthProvider
 
 
-@pytest.mark.asyncio
 async def test_generate_uses_access_token():
     token = "token"
     provider = GoogleOAuthProvider(token_getter=AsyncMock(return_value=token))
@@ -21,3 +18,14 @@ async def test_generate_uses_access_token():
         token,
         ANY,
     )
+
+
+async def test_generate_uses_model_override_path():
+    provider = GoogleOAuthProvider(token_getter=AsyncMock(return_value="token"))
+    provider._post = AsyncMock(return_value={"content": "ok"})
+    await provider.generate("sys", "msg", model="gemini-1.5-pro")
+    provider._post.assert_awaited_once_with(
+        "/models/gemini-1.5-pro:generateContent",
+        "token",
+        ANY,
+    )
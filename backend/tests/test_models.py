@@ -70,6 +70,15 @@ class TestAgentConfig:
         assert agent.custom_prompt is None
         assert agent.model is None
 
+    def test_agent_ids_are_unique_v4_uuids(self):
+        """Test that auto-generated agent IDs are distinct version 4 UUIDs."""
+        agents = [
+            AgentConfig(name=f"Agent {i}", provider=ProviderType.OPENAI, role=RoleType.CUSTOM)
+            for i in range(3)
+        ]
+        assert all(agent.id.version == 4 for agent in agents)
+        assert len({agent.id for agent in agents}) == 3
+
     def test_create_custom_role_agent(self):
         """Test creating an agent with a custom role."""
         agent = AgentConfig(
@@ -171,6 +180,7 @@ class TestDebate:
         assert "council_id" in data
         assert "topic" in data
         assert data["topic"] == "Serialization test"
+        assert Debate.model_validate_json(debate.model_dump_json()) == debate
 
 
 class TestDebateRound:
@@ -228,6 +238,11 @@ class TestRolePrompts:
             if role != RoleType.CUSTOM:
                 assert len(ROLE_PROMPTS[role]) > 0
 
+    def test_role_prompts_read_only(self):
+        """Test that role prompts cannot be modified at runtime."""
+        with pytest.raises(TypeError):
+            ROLE_PROMPTS[RoleType.CUSTOM] = "Overridden"  # type: ignore[index]
+
 
 class TestDebateCreate:
     """Tests for DebateCreate request model."""
@@ -257,3 +272,9 @@ class TestDebateUpdate:
         assert update.debate_id == debate_id
         assert update.event_type == "round_start"
         assert update.data["round"] == 1
+
+    def test_debate_update_is_frozen(self):
+        """Test that a DebateUpdate cannot be modified after creation."""
+        update = DebateUpdate(debate_id=uuid4(), event_type="round_start", data={})
+        with pytest.raises(ValidationError):
+            update.event_type = "round_complete"
@@ -10,19 +10,24 @@ def test_store_roundtrip(tmp_path):
     assert loaded[0]["email"] == "a@b.com"
 
 
-def test_has_accounts_true_when_data_exists(tmp_path):
-    store = OAuthAccountStore(tmp_path / "accounts.json")
-    store.save_accounts([
+def test_in_memory_store_roundtrip(oauth_account_store):
+    oauth_account_store.save_accounts([
         {"email": "a@b.com", "refresh_token": "r", "project_id": "p"}
     ])
+    loaded = oauth_account_store.load_accounts()
+    assert loaded[0]["email"] == "a@b.com"
 
-    assert store.has_accounts() is True
 
+def test_has_accounts_true_when_data_exists(oauth_account_store):
+    oauth_account_store.save_accounts([
+        {"email": "a@b.com", "refresh_token": "r", "project_id": "p"}
+    ])
+
+    assert oauth_account_store.has_accounts() is True
 
-def test_has_accounts_false_when_missing(tmp_path):
-    store = OAuthAccountStore(tmp_path / "accounts.json")
 
-    assert store.has_accounts() is False
+def test_has_accounts_false_when_missing(oauth_account_store):
+    assert oauth_account_store.has_accounts() is False
 
 
 def test_load_accounts_returns_empty_on_invalid_json(tmp_path, caplog):
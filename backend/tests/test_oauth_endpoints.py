@@ -2,97 +2,58 @@
 Tests for OAuth endpoints.
 """
 
-from urllib.parse import parse_qs, urlparse
-from unittest.mock import AsyncMock
+from urllib.parse import parse_qsl, urlsplit
 
+import httpx
 import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
 
-from app.main import app
-from app.oauth_accounts import OAuthAccountStore
-from app.oauth_server import OAuthServer
-
-pytestmark = pytest.mark.asyncio
 
+def _google_api(request: httpx.Request) -> httpx.Response:
+    """Answer Google's token and userinfo endpoints for the callback flow."""
+    if request.url.path == "/token":
+        return httpx.Response(
+            200,
+            json={"access_token": "access", "refresh_token": "refresh", "project_id": "project"},
+        )
+    if request.url.path == "/oauth2/v3/userinfo":
+        return httpx.Response(200, json={"email": "user@example.com"})
+    return httpx.Response(404)
 
-@pytest_asyncio.fixture
-async def client():
-    """Create an async test client."""
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
 
+@pytest.fixture
+def oauth_http_client():
+    """Send the test server's Google API calls to _google_api."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(_google_api))
 
-def _set_oauth_server(server: OAuthServer) -> OAuthServer | None:
-    previous = getattr(app.state, "oauth_server", None)
-    app.state.oauth_server = server
-    return previous
 
+@pytest.fixture
+def valid_state(oauth_server):
+    """Register a login state on the test server without going through the login endpoint."""
+    return dict(parse_qsl(urlsplit(oauth_server.get_login_url()).query))["state"]
 
-async def test_google_oauth_login_returns_url(client, tmp_path):
-    store = OAuthAccountStore(tmp_path / "accounts.json")
-    server = OAuthServer(
-        client_id="client",
-        client_secret="secret",
-        redirect_uri="http://localhost/api/providers/google-oauth/callback",
-        account_store=store,
-    )
-    previous = _set_oauth_server(server)
 
-    try:
-        response = await client.get("/api/providers/google-oauth/login")
-    finally:
-        if previous is None:
-            delattr(app.state, "oauth_server")
-        else:
-            app.state.oauth_server = previous
+async def test_google_oauth_login_returns_url(client, oauth_server):
+    response = await client.get("/api/providers/google-oauth/login")
 
     assert response.status_code == 200
     data = response.json()
     assert "url" in data
-    url = data["url"]
-    assert "code_challenge" in url
-    assert "code_challenge_method=S256" in url
+    query = dict(parse_qsl(urlsplit(data["url"]).query))
+    assert "code_challenge" in query
+    assert query["code_challenge_method"] == "S256"
+    assert query["state"]
 
 
-async def test_google_oauth_callback_stores_account(client, tmp_path):
-    store = OAuthAccountStore(tmp_path / "accounts.json")
-    server = OAuthServer(
-        client_id="client",
-        client_secret="secret",
-        redirect_uri="http://localhost/api/providers/google-oauth/callback",
-        account_store=store,
+async def test_google_oauth_callback_stores_account(client, oauth_server, valid_state):
+    response = await client.get(
+        "/api/providers/google-oauth/callback",
+        params={"code": "auth-code", "state": valid_state},
     )
-    server._exchange_code = AsyncMock(
-        return_value={
-            "access_token": "access",
-            "refresh_token": "refresh",
-            "project_id": "project",
-        }
-    )
-    server._fetch_user_profile = AsyncMock(return_value={"email": "user@example.com"})
-    previous = _set_oauth_server(server)
-
-    try:
-        login_response = await client.get("/api/providers/google-oauth/login")
-        login_url = login_response.json()["url"]
-        query = parse_qs(urlparse(login_url).query)
-        state = query["state"][0]
-        response = await client.get(
-            "/api/providers/google-oauth/callback",
-            params={"code": "auth-code", "state": state},
-        )
-    finally:
-        if previous is None:
-            delattr(app.state, "oauth_server")
-        else:
-            app.state.oauth_server = previous
 
     assert response.status_code == 200
     data = response.json()
     assert data["account"]["email"] == "user@example.com"
-    accounts = store.load_accounts()
+    accounts = oauth_server.account_store.load_accounts()
     assert accounts == [
         {
             "email": "user@example.com",
@@ -1,3 +1,5 @@
+import pytest
+
 from app.oauth_server import (
     ANTIGRAVITY_CLIENT_ID,
     ANTIGRAVITY_CLIENT_SECRET,
@@ -6,13 +8,25 @@ from app.oauth_server import (
 )
 
 
-def test_oauth_server_defaults_use_antigravity_settings(monkeypatch):
-    monkeypatch.delenv("GOOGLE_OAUTH_CLIENT_ID", raising=False)
-    monkeypatch.delenv("GOOGLE_OAUTH_CLIENT_SECRET", raising=False)
-    monkeypatch.delenv("GOOGLE_OAUTH_SCOPE", raising=False)
+def test_oauth_server_defaults_use_antigravity_settings():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("GOOGLE_OAUTH_CLIENT_ID", raising=False)
+        mp.delenv("GOOGLE_OAUTH_CLIENT_SECRET", raising=False)
+        mp.delenv("GOOGLE_OAUTH_SCOPE", raising=False)
 
-    server = create_oauth_server()
+        server = create_oauth_server()
 
     assert server.client_id == ANTIGRAVITY_CLIENT_ID
     assert server.client_secret == ANTIGRAVITY_CLIENT_SECRET
     assert ANTIGRAVITY_SCOPES[0] in server.scope
+
+
+def test_oauth_server_reads_settings_from_env():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GOOGLE_OAUTH_CLIENT_ID", "client")
+        mp.setenv("GOOGLE_OAUTH_SCOPE", "email")
+
+        server = create_oauth_server()
+
+    assert server.client_id == "client"
+    assert server.scope == "email"
@@ -1,62 +1,76 @@
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
+import pytest_asyncio
 
 from app.providers.ollama_provider import OllamaProvider
 
+_STREAM_LINES = (
+    '{"message": {"content": "Hello"}, "done": false}',
+    '{"message": {"content": " world"}, "done": true}',
+)
 
-@pytest.fixture
-def ollama_provider():
-    return OllamaProvider(base_url="http://localhost:11434/api")
 
-
-@pytest.mark.asyncio
-async def test_ollama_generate(ollama_provider):
-    mock_client = AsyncMock()
-    mock_response = MagicMock()
+def _mock_response(json_data=None) -> MagicMock:
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
     mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {"message": {"content": "Test response"}}
-    mock_client.post.return_value = mock_response
+    mock_response.json.return_value = json_data
+    return mock_response
 
-    ollama_provider.client = mock_client
 
-    response = await ollama_provider.generate(system_prompt="sys", user_message="user")
-    assert response == "Test response"
-    mock_client.post.assert_called_once()
+def _make_mock_client(*, post_json=None, get_json=None, stream_lines=None) -> AsyncMock:
+    """Build a mock httpx client whose post/get/stream return the given payloads."""
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    if post_json is not None:
+        mock_client.post.return_value = _mock_response(post_json)
+    if get_json is not None:
+        mock_client.get.return_value = _mock_response(get_json)
+    if stream_lines is not None:
+        mock_response = _mock_response()
+        mock_response.aread = AsyncMock(return_value=b"error text")
 
+        async def aiter_lines():
+            for line in stream_lines:
+                yield line
 
-@pytest.mark.asyncio
-async def test_ollama_generate_stream(ollama_provider):
-    mock_client = AsyncMock()
+        mock_response.aiter_lines = aiter_lines
 
-    # Mock the response object
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.raise_for_status.return_value = None
-    mock_response.aread = AsyncMock(return_value=b"error text")
+        mock_ctx = AsyncMock()
+        mock_ctx.__aenter__.return_value = mock_response
+        # stream() is not async, it returns an async context manager
+        mock_client.stream = MagicMock(return_value=mock_ctx)
+    return mock_client
 
-    # Mock aiter_lines
-    lines = [
-        '{"message": {"content": "Hello"}, "done": false}',
-        '{"message": {"content": " world"}, "done": true}',
-    ]
 
-    async def mock_aiter_lines():
-        for line in lines:
-            yield line
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def ollama_provider():
+    provider = OllamaProvider(base_url="http://localhost:11434/api")
+    original_client = provider.client
+    yield provider
+    await original_client.aclose()
 
-    mock_response.aiter_lines = mock_aiter_lines
 
-    # Mock the context manager returned by stream()
-    mock_ctx = AsyncMock()
-    mock_ctx.__aenter__.return_value = mock_response
+@pytest.fixture(autouse=True)
+def _restore_client(ollama_provider):
+    original_client = ollama_provider.client
+    yield
+    ollama_provider.client = original_client
 
-    # Important: stream() is not async, it returns an async context manager
-    # So we replace the auto-created AsyncMock with a MagicMock for the method itself
-    mock_client.stream = MagicMock(return_value=mock_ctx)
 
+async def test_ollama_generate(ollama_provider):
+    mock_client = _make_mock_client(post_json={"message": {"content": "Test response"}})
     ollama_provider.client = mock_client
 
+    response = await ollama_provider.generate(system_prompt="sys", user_message="user")
+    assert response == "Test response"
+    mock_client.post.assert_called_once()
+
+
+async def test_ollama_generate_stream(ollama_provider):
+    ollama_provider.client = _make_mock_client(stream_lines=_STREAM_LINES)
+
     chunks = []
     async for chunk in ollama_provider.generate_stream(system_prompt="sys", user_message="user"):
         chunks.append(chunk)
@@ -64,15 +78,10 @@ async def test_ollama_generate_stream(ollama_provider):
     assert "".join(chunks) == "Hello world"
 
 
-@pytest.mark.asyncio
 async def test_ollama_list_models(ollama_provider):
-    mock_client = AsyncMock()
-    mock_response = MagicMock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {"models": [{"name": "llama3"}, {"name": "mistral"}]}
-    mock_client.get.return_value = mock_response
-
-    ollama_provider.client = mock_client
+    ollama_provider.client = _make_mock_client(
+        get_json={"models": [{"name": "llama3"}, {"name": "mistral"}]}
+    )
 
     models = await ollama_provider.list_models()
     assert "llama3" in models
@@ -2,148 +2,226 @@
 Tests for AI Provider Implementations
 """
 
+import asyncio
+import itertools
+from collections.abc import Iterable
+from dataclasses import dataclass
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import anthropic
+import openai
 import pytest
+from google import genai
+from google.genai import types
 
 from app.models import ROLE_PROMPTS, AgentConfig, ProviderType, RoleType
 from app.providers import ProviderRegistry
 from app.providers.anthropic_provider import AnthropicProvider
 from app.providers.gemini_provider import GeminiProvider
 from app.providers.openai_provider import OpenAIProvider
+from app.tools.registry import ToolRegistry
 
 
 def test_provider_type_includes_google_oauth():
     assert ProviderType.GOOGLE_OAUTH.value == "google_oauth"
 
 
+_CUSTOM_AGENT = AgentConfig(
+    name="Custom Agent",
+    provider=ProviderType.GEMINI,
+    role=RoleType.CUSTOM,
+    custom_prompt="You are a specialized custom agent.",
+)
+
+
 class TestBaseProvider:
     """Tests for BaseProvider abstract class."""
 
-    def test_get_system_prompt_standard_role(self, sample_agent_gemini):
-        """Test getting system prompt for a standard role."""
-        # Create a concrete instance for testing
-        with patch.object(GeminiProvider, "__init__", lambda self, api_key: None):
-            provider = GeminiProvider.__new__(GeminiProvider)
-            provider.api_key = "test-key"
+    @pytest.fixture
+    def provider(self) -> GeminiProvider:
+        """Create a concrete provider with a mocked SDK client."""
+        return GeminiProvider("test-key", client=MagicMock(spec=genai.Client))
 
-            prompt = provider.get_system_prompt(sample_agent_gemini)
-            assert prompt == ROLE_PROMPTS[RoleType.TECH_STRATEGIST]
+    def test_get_system_prompt_standard_role(self, provider, sample_agent_gemini):
+        """Test getting system prompt for a standard role."""
+        prompt = provider.get_system_prompt(sample_agent_gemini)
+        assert prompt == ROLE_PROMPTS[RoleType.TECH_STRATEGIST]
 
-    def test_get_system_prompt_custom_role(self):
+    def test_get_system_prompt_custom_role(self, provider):
         """Test getting system prompt for a custom role."""
-        custom_agent = AgentConfig(
-            name="Custom Agent",
-            provider=ProviderType.GEMINI,
-            role=RoleType.CUSTOM,
-            custom_prompt="You are a specialized custom agent.",
-        )
-
-        with patch.object(GeminiProvider, "__init__", lambda self, api_key: None):
-            provider = GeminiProvider.__new__(GeminiProvider)
-            provider.api_key = "test-key"
-
-            prompt = provider.get_system_prompt(custom_agent)
-            assert prompt == "You are a specialized custom agent."
+        prompt = provider.get_system_prompt(_CUSTOM_AGENT)
+        assert prompt == "You are a specialized custom agent."
 
-    def test_get_system_prompt_devils_advocate(self, sample_agent_devils_advocate):
+    def test_get_system_prompt_devils_advocate(self, provider, sample_agent_devils_advocate):
         """Test getting system prompt for Devil's Advocate role."""
-        with patch.object(GeminiProvider, "__init__", lambda self, api_key: None):
-            provider = GeminiProvider.__new__(GeminiProvider)
-            provider.api_key = "test-key"
-
-            prompt = provider.get_system_prompt(sample_agent_devils_advocate)
-            assert "challenge assumptions" in prompt.lower()
+        prompt = provider.get_system_prompt(sample_agent_devils_advocate)
+        assert "challenge assumptions" in prompt.lower()
 
 
 class TestProviderRegistry:
     """Tests for ProviderRegistry."""
 
+    @pytest.fixture(autouse=True)
+    def settings(self, monkeypatch) -> SimpleNamespace:
+        """Give each test its own empty registry and no configured providers."""
+        settings = SimpleNamespace(
+            openai_api_key=None,
+            anthropic_api_key=None,
+            gemini_api_key=None,
+            ollama_base_url=None,
+            ollama_api_key=None,
+        )
+        monkeypatch.setattr("app.providers.get_settings", lambda: settings)
+        monkeypatch.setattr(ProviderRegistry, "_providers", {})
+        return settings
+
     def test_registry_empty_initially(self):
         """Test that registry is empty before initialization."""
-        # Clear any existing providers
-        ProviderRegistry._providers.clear()
         assert ProviderRegistry.get_available() == []
 
     def test_is_available_when_not_configured(self):
         """Test is_available returns False for unconfigured providers."""
-        ProviderRegistry._providers.clear()
         assert ProviderRegistry.is_available(ProviderType.OPENAI) is False
         assert ProviderRegistry.is_available(ProviderType.ANTHROPIC) is False
 
     def test_get_returns_none_for_unavailable(self):
         """Test get returns None for unavailable provider."""
-        ProviderRegistry._providers.clear()
         assert ProviderRegistry.get(ProviderType.OPENAI) is None
 
-    @patch("app.providers.get_settings")
-    def test_initialize_with_openai_key(self, mock_settings):
-        """Test initialization with OpenAI API key."""
-        mock_settings.return_value = MagicMock(
-            openai_api_key="test-openai-key",
-            anthropic_api_key=None,
-            gemini_api_key=None,
-            ollama_base_url="http://localhost:11434",
-        )
+    @pytest.mark.parametrize(
+        ("keys", "has_oauth_accounts", "expected"),
+        [
+            pytest.param(
+                {"openai_api_key": "test-openai-key", "ollama_base_url": "http://localhost:11434"},
+                False,
+                {ProviderType.OPENAI, ProviderType.OLLAMA},
+                id="openai",
+            ),
+            pytest.param(
+                {
+                    "openai_api_key": "test-openai-key",
+                    "anthropic_api_key": "test-anthropic-key",
+                    "gemini_api_key": "test-gemini-key",
+                    "ollama_base_url": "http://localhost:11434",
+                },
+                False,
+                {
+                    ProviderType.OPENAI,
+                    ProviderType.ANTHROPIC,
+                    ProviderType.GEMINI,
+                    ProviderType.OLLAMA,
+                },
+                id="all_keys",
+            ),
+            pytest.param({}, True, {ProviderType.GOOGLE_OAUTH}, id="google_oauth_account"),
+            pytest.param({}, False, set(), id="nothing_configured"),
+        ],
+    )
+    def test_initialize(self, settings, monkeypatch, keys, has_oauth_accounts, expected):
+        """Test initialize registers exactly the configured providers."""
+        for name, value in keys.items():
+            setattr(settings, name, value)
+        store = SimpleNamespace(has_accounts=lambda: has_oauth_accounts)
+        monkeypatch.setattr("app.providers.OAuthAccountStore", lambda _path: store)
 
-        ProviderRegistry._providers.clear()
         ProviderRegistry.initialize()
 
-        assert ProviderRegistry.is_available(ProviderType.OPENAI)
-        assert not ProviderRegistry.is_available(ProviderType.ANTHROPIC)
-        assert not ProviderRegistry.is_available(ProviderType.GEMINI)
-
-    @patch("app.providers.get_settings")
-    def test_initialize_with_all_keys(self, mock_settings):
-        """Test initialization with all API keys."""
-        mock_settings.return_value = MagicMock(
-            openai_api_key="test-openai-key",
-            anthropic_api_key="test-anthropic-key",
-            gemini_api_key="test-gemini-key",
-            ollama_base_url="http://localhost:11434",
-        )
+        assert set(ProviderRegistry.get_available()) == expected
 
-        ProviderRegistry._providers.clear()
-        ProviderRegistry.initialize()
 
-        available = ProviderRegistry.get_available()
-        assert ProviderType.OPENAI in available
-        assert ProviderType.ANTHROPIC in available
-        assert ProviderType.GEMINI in available
+@dataclass(frozen=True, slots=True)
+class _Message:
+    content: str
 
-    @patch("app.providers.OAuthAccountStore")
-    @patch("app.providers.get_settings")
-    def test_initialize_with_google_oauth_account(self, mock_settings, mock_store):
-        """Test initialization registers Google OAuth provider when accounts exist."""
-        mock_settings.return_value = MagicMock(
-            openai_api_key=None,
-            anthropic_api_key=None,
-            gemini_api_key=None,
-            ollama_base_url=None,
-        )
-        mock_store.return_value.has_accounts.return_value = True
 
-        ProviderRegistry._providers.clear()
-        ProviderRegistry.initialize()
+@dataclass(frozen=True, slots=True)
+class _Choice:
+    message: _Message
 
-        assert ProviderRegistry.is_available(ProviderType.GOOGLE_OAUTH)
 
-    @patch("app.providers.OAuthAccountStore")
-    @patch("app.providers.get_settings")
-    def test_initialize_without_google_oauth_account(self, mock_settings, mock_store):
-        """Test initialization does NOT register Google OAuth provider when no accounts exist."""
-        mock_settings.return_value = MagicMock(
-            openai_api_key=None,
-            anthropic_api_key=None,
-            gemini_api_key=None,
-            ollama_base_url=None,
-        )
-        mock_store.return_value.has_accounts.return_value = False
+@dataclass(frozen=True, slots=True)
+class _OpenAIResponse:
+    choices: list[_Choice]
 
-        ProviderRegistry._providers.clear()
-        ProviderRegistry.initialize()
 
-        assert not ProviderRegistry.is_available(ProviderType.GOOGLE_OAUTH)
+@dataclass(frozen=True, slots=True)
+class _TextBlock:
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class _AnthropicResponse:
+    content: list[_TextBlock]
+
+
+@dataclass(frozen=True, slots=True)
+class _GeminiResponse:
+    text: str
+
+
+def _mock_openai_client(mock_client: MagicMock) -> AsyncMock:
+    mock_response = _OpenAIResponse(choices=[_Choice(message=_Message(content="Test response"))])
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+    return mock_client.chat.completions.create
+
+
+def _mock_anthropic_client(mock_client: MagicMock) -> AsyncMock:
+    mock_response = _AnthropicResponse(content=[_TextBlock(text="Test response from Claude")])
+    mock_client.messages.create = AsyncMock(return_value=mock_response)
+    return mock_client.messages.create
+
+
+def _mock_gemini_client(mock_client: MagicMock) -> AsyncMock:
+    mock_response = _GeminiResponse(text="Test response from Gemini")
+    mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
+    return mock_client.aio.models.generate_content
+
+
+PROVIDER_CASES = [
+    pytest.param(
+        OpenAIProvider,
+        "openai.AsyncOpenAI",
+        openai.AsyncOpenAI,
+        _mock_openai_client,
+        "Test response",
+        id="openai",
+    ),
+    pytest.param(
+        AnthropicProvider,
+        "anthropic.AsyncAnthropic",
+        anthropic.AsyncAnthropic,
+        _mock_anthropic_client,
+        "Test response from Claude",
+        id="anthropic",
+    ),
+    pytest.param(
+        GeminiProvider,
+        "app.providers.gemini_provider.genai.Client",
+        genai.Client,
+        _mock_gemini_client,
+        "Test response from Gemini",
+        id="gemini",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("provider_cls", "client_path", "client_spec", "build_client", "expected"), PROVIDER_CASES
+)
+async def test_provider_generate(provider_cls, client_path, client_spec, build_client, expected):
+    """Test each provider's generate method against its mocked SDK client."""
+    with patch(client_path, return_value=MagicMock(spec=client_spec)) as mock_client_class:
+        create = build_client(mock_client_class.return_value)
+
+        provider = provider_cls("test-key")
+        result = await provider.generate(
+            system_prompt="You are a test assistant.",
+            user_message="Hello!",
+        )
+
+        assert result == expected
+        assert create.await_count == 1
 
 
 class TestOpenAIProvider:
@@ -151,377 +229,246 @@ class TestOpenAIProvider:
 
     def test_provider_properties(self):
         """Test OpenAI provider properties."""
-        with patch("app.providers.openai_provider.AsyncOpenAI"):
+        with patch("openai.AsyncOpenAI"):
             provider = OpenAIProvider("test-key")
             assert provider.name == "openai"
             assert provider.default_model == "gpt-4o"
 
-    @pytest.mark.asyncio
-    async def test_generate_method(self):
-        """Test OpenAI generate method with mocked client."""
-        with patch("app.providers.openai_provider.AsyncOpenAI") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-
-            # Mock the response
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock(message=MagicMock(content="Test response"))]
-            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-
-            provider = OpenAIProvider("test-key")
-            result = await provider.generate(
-                system_prompt="You are a test assistant.",
-                user_message="Hello!",
-            )
-
-            assert result == "Test response"
-            mock_client.chat.completions.create.assert_called_once()
-
 
 class TestAnthropicProvider:
     """Tests for Anthropic provider implementation."""
 
     def test_provider_properties(self):
         """Test Anthropic provider properties."""
-        with patch("app.providers.anthropic_provider.anthropic.AsyncAnthropic"):
+        with patch("anthropic.AsyncAnthropic"):
             provider = AnthropicProvider("test-key")
             assert provider.name == "anthropic"
             assert "claude" in provider.default_model.lower()
 
-    @pytest.mark.asyncio
-    async def test_generate_method(self):
-        """Test Anthropic generate method with mocked client."""
-        with patch(
-            "app.providers.anthropic_provider.anthropic.AsyncAnthropic"
-        ) as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
 
-            # Mock the response
-            mock_response = MagicMock()
-            mock_response.content = [MagicMock(text="Test response from Claude")]
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
+def _tool_call_response(name: str, args: dict) -> types.GenerateContentResponse:
+    """Build a Gemini response whose only part asks for one function call."""
+    part = types.Part(function_call=types.FunctionCall(name=name, args=args))
+    content = types.Content(role="model", parts=[part])
+    return types.GenerateContentResponse(candidates=[types.Candidate(content=content)])
+
+
+def _text_response(text: str) -> types.GenerateContentResponse:
+    """Build a Gemini response that answers with text and no function calls."""
+    content = types.Content(role="model", parts=[types.Part(text=text)])
+    return types.GenerateContentResponse(candidates=[types.Candidate(content=content)])
+
+
+def _replay(responses: Iterable[types.GenerateContentResponse]):
+    """Build a generate_content stand-in that returns the given responses in order."""
+    replies = iter(responses)
+
+    async def generate_content(**_kwargs) -> types.GenerateContentResponse:
+        return next(replies)
+
+    return generate_content
 
-            provider = AnthropicProvider("test-key")
-            result = await provider.generate(
-                system_prompt="You are a test assistant.",
-                user_message="Hello!",
-            )
 
-            assert result == "Test response from Claude"
+_AAPL_QUOTE_CALL = _tool_call_response("get_stock_quote", {"symbol": "AAPL"})
+
+
+@pytest.fixture(scope="module")
+def gemini_client() -> MagicMock:
+    """Create one mocked genai client shared by the Gemini tests."""
+    return MagicMock(spec=genai.Client)
+
+
+@pytest.fixture(scope="module")
+def gemini_provider(gemini_client) -> GeminiProvider:
+    """Create a Gemini provider backed by the mocked client."""
+    return GeminiProvider("test-key", client=gemini_client)
 
 
 class TestGeminiProvider:
     """Tests for Gemini provider implementation."""
 
-    def test_provider_properties(self):
+    @pytest.fixture(autouse=True)
+    def _fresh_generate_content(self, gemini_client):
+        """Give each test its own awaitable generate_content."""
+        gemini_client.aio.models.generate_content = AsyncMock()
+
+    @pytest.fixture
+    def execute_tool(self, monkeypatch) -> AsyncMock:
+        """Replace ToolRegistry.execute_tool with an awaitable mock."""
+        mock_execute = AsyncMock()
+        monkeypatch.setattr(ToolRegistry, "execute_tool", mock_execute)
+        return mock_execute
+
+    def test_provider_properties(self, gemini_provider):
         """Test Gemini provider properties."""
-        with patch("app.providers.gemini_provider.genai.Client"):
-            provider = GeminiProvider("test-key")
-            assert provider.name == "gemini"
-            assert "gemini" in provider.default_model.lower()
-
-    @pytest.mark.asyncio
-    async def test_generate_method(self):
-        """Test Gemini generate method with mocked client."""
-        with patch("app.providers.gemini_provider.genai.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-            mock_client.aio = MagicMock()
-
-            mock_response = MagicMock()
-            mock_response.text = "Test response from Gemini"
-            mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
-
-            provider = GeminiProvider("test-key")
-            result = await provider.generate(
-                system_prompt="You are a test assistant.",
-                user_message="Hello!",
-            )
-
-            assert result == "Test response from Gemini"
-
-    @pytest.mark.asyncio
-    async def test_generate_with_tools(self):
+        assert gemini_provider.name == "gemini"
+        assert "gemini" in gemini_provider.default_model.lower()
+
+    async def test_generate_with_tools(self, gemini_client, gemini_provider, execute_tool):
         """Test Gemini generate_with_tools method."""
-        with patch("app.providers.gemini_provider.genai.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-            mock_client.aio = MagicMock()
-
-            mock_fc = MagicMock()
-            mock_fc.name = "get_stock_quote"
-            mock_fc.args = {"symbol": "AAPL"}
-
-            mock_part = MagicMock()
-            mock_part.function_call = mock_fc
-
-            mock_candidate = MagicMock()
-            mock_candidate.content.parts = [mock_part]
-
-            mock_response_1 = MagicMock()
-            mock_response_1.candidates = [mock_candidate]
-            mock_response_1.text = None
-
-            # 2. Second call returns final text
-            mock_candidate_2 = MagicMock()
-            mock_candidate_2.content.parts = []
-            mock_response_2 = MagicMock()
-            mock_response_2.candidates = [mock_candidate_2]
-            mock_response_2.text = "Apple is doing well."
-
-            mock_client.aio.models.generate_content = AsyncMock(
-                side_effect=[mock_response_1, mock_response_2]
-            )
-
-            with patch(
-                "app.tools.registry.ToolRegistry.execute_tool", new_callable=AsyncMock
-            ) as mock_execute:
-                mock_execute.return_value = {"price": 150}
-
-                provider = GeminiProvider("test-key")
-                text, calls = await provider.generate_with_tools(
-                    system_prompt="Test", user_message="How is AAPL?", tools=[MagicMock()]
-                )
-
-                assert text == "Apple is doing well."
-                assert len(calls) == 1
-                assert calls[0]["name"] == "get_stock_quote"
-                assert calls[0]["result"] == {"price": 150}
-
-    @pytest.mark.asyncio
-    async def test_generate_with_tools_no_function_calls(self):
-        """Test generate_with_tools when model doesn't call any functions."""
-        with patch("app.providers.gemini_provider.genai.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-            mock_client.aio = MagicMock()
+        gemini_client.aio.models.generate_content = _replay(
+            [
+                _tool_call_response("get_stock_quote", {"symbol": "AAPL"}),
+                _text_response("Apple is doing well."),
+            ]
+        )
 
-            # Mock response with no function calls
-            mock_candidate = MagicMock()
-            mock_candidate.content.parts = []
+        execute_tool.return_value = {"price": 150}
 
-            mock_response = MagicMock()
-            mock_response.candidates = [mock_candidate]
-            mock_response.text = "Direct answer without tools."
+        text, calls = await gemini_provider.generate_with_tools(
+            system_prompt="Test", user_message="How is AAPL?", tools=[MagicMock()]
+        )
 
-            mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
+        assert text == "Apple is doing well."
+        assert len(calls) == 1
+        assert calls[0]["name"] == "get_stock_quote"
+        assert calls[0]["result"] == {"price": 150}
 
-            provider = GeminiProvider("test-key")
-            text, calls = await provider.generate_with_tools(
-                system_prompt="Test", user_message="Hello!", tools=[MagicMock()]
-            )
+    async def test_generate_with_tools_no_function_calls(self, gemini_client, gemini_provider):
+        """Test generate_with_tools when model doesn't call any functions."""
+        gemini_client.aio.models.generate_content.return_value = _text_response(
+            "Direct answer without tools."
+        )
 
-            assert text == "Direct answer without tools."
-            assert len(calls) == 0
+        text, calls = await gemini_provider.generate_with_tools(
+            system_prompt="Test", user_message="Hello!", tools=[MagicMock()]
+        )
+
+        assert text == "Direct answer without tools."
+        assert len(calls) == 0
 
-    @pytest.mark.asyncio
-    async def test_generate_with_tools_multiple_calls(self):
+    async def test_generate_with_tools_multiple_calls(
+        self, gemini_client, gemini_provider, execute_tool
+    ):
         """Test generate_with_tools with multiple sequential tool calls."""
-        with patch("app.providers.gemini_provider.genai.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-            mock_client.aio = MagicMock()
-
-            # First response: function call for stock quote
-            mock_fc_1 = MagicMock()
-            mock_fc_1.name = "get_stock_quote"
-            mock_fc_1.args = {"symbol": "AAPL"}
-
-            mock_part_1 = MagicMock()
-            mock_part_1.function_call = mock_fc_1
-
-            mock_candidate_1 = MagicMock()
-            mock_candidate_1.content.parts = [mock_part_1]
-
-            mock_response_1 = MagicMock()
-            mock_response_1.candidates = [mock_candidate_1]
-            mock_response_1.text = None
-
-            # Second response: function call for news
-            mock_fc_2 = MagicMock()
-            mock_fc_2.name = "get_stock_news"
-            mock_fc_2.args = {"symbol": "AAPL"}
-
-            mock_part_2 = MagicMock()
-            mock_part_2.function_call = mock_fc_2
-
-            mock_candidate_2 = MagicMock()
-            mock_candidate_2.content.parts = [mock_part_2]
-
-            mock_response_2 = MagicMock()
-            mock_response_2.candidates = [mock_candidate_2]
-            mock_response_2.text = None
-
-            # Third response: final answer
-            mock_candidate_3 = MagicMock()
-            mock_candidate_3.content.parts = []
-
-            mock_response_3 = MagicMock()
-            mock_response_3.candidates = [mock_candidate_3]
-            mock_response_3.text = "Analysis complete."
-
-            mock_client.aio.models.generate_content = AsyncMock(
-                side_effect=[mock_response_1, mock_response_2, mock_response_3]
-            )
-
-            with patch(
-                "app.tools.registry.ToolRegistry.execute_tool", new_callable=AsyncMock
-            ) as mock_execute:
-                mock_execute.return_value = {"result": "ok"}
-
-                provider = GeminiProvider("test-key")
-                text, calls = await provider.generate_with_tools(
-                    system_prompt="Test", user_message="Analyze AAPL", tools=[MagicMock()]
-                )
-
-                assert text == "Analysis complete."
-                assert len(calls) == 2
-                assert calls[0]["name"] == "get_stock_quote"
-                assert calls[1]["name"] == "get_stock_news"
-
-    @pytest.mark.asyncio
-    async def test_generate_with_tools_tool_error(self):
+        gemini_client.aio.models.generate_content = _replay(
+            [
+                _tool_call_response("get_stock_quote", {"symbol": "AAPL"}),
+                _tool_call_response("get_stock_news", {"symbol": "AAPL"}),
+                _text_response("Analysis complete."),
+            ]
+        )
+
+        execute_tool.return_value = {"result": "ok"}
+
+        text, calls = await gemini_provider.generate_with_tools(
+            system_prompt="Test", user_message="Analyze AAPL", tools=[MagicMock()]
+        )
+
+        assert text == "Analysis complete."
+        assert len(calls) == 2
+        assert calls[0]["name"] == "get_stock_quote"
+        assert calls[1]["name"] == "get_stock_news"
+
+    async def test_generate_with_tools_runs_turn_calls_concurrently(
+        self, gemini_client, gemini_provider, execute_tool
+    ):
+        """Test tool calls requested in one turn run together and keep their order."""
+        parts = [
+            types.Part(function_call=types.FunctionCall(name=name, args={"symbol": "AAPL"}))
+            for name in ("get_stock_quote", "get_stock_news")
+        ]
+        content = types.Content(role="model", parts=parts)
+        gemini_client.aio.models.generate_content = _replay(
+            [
+                types.GenerateContentResponse(candidates=[types.Candidate(content=content)]),
+                _text_response("Analysis complete."),
+            ]
+        )
+
+        # Neither call can finish until both have started
+        started = []
+        both_started = asyncio.Event()
+
+        async def execute(name, args):
+            started.append(name)
+            if len(started) == len(parts):
+                both_started.set()
+            await both_started.wait()
+            return {"tool": name}
+
+        execute_tool.side_effect = execute
+
+        text, calls = await asyncio.wait_for(
+            gemini_provider.generate_with_tools(
+                system_prompt="Test", user_message="Analyze AAPL", tools=[MagicMock()]
+            ),
+            timeout=1,
+        )
+
+        assert text == "Analysis complete."
+        assert [call["name"] for call in calls] == ["get_stock_quote", "get_stock_news"]
+        assert calls[1]["result"] == {"tool": "get_stock_news"}
+
+    async def test_generate_with_tools_tool_error(
+        self, gemini_client, gemini_provider, execute_tool
+    ):
         """Test generate_with_tools when tool execution fails - tool call should still be recorded."""
-        with patch("app.providers.gemini_provider.genai.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-            mock_client.aio = MagicMock()
-
-            # First response: function call
-            mock_fc = MagicMock()
-            mock_fc.name = "get_stock_quote"
-            mock_fc.args = {"symbol": "INVALID"}
-
-            mock_part = MagicMock()
-            mock_part.function_call = mock_fc
-
-            mock_candidate = MagicMock()
-            mock_candidate.content.parts = [mock_part]
-
-            mock_response = MagicMock()
-            mock_response.candidates = [mock_candidate]
-            mock_response.text = None
-
-            # Second response: after tool error, model responds with text
-            mock_candidate_2 = MagicMock()
-            mock_candidate_2.content.parts = []
-
-            mock_response_2 = MagicMock()
-            mock_response_2.candidates = [mock_candidate_2]
-            mock_response_2.text = "Could not fetch stock data."
-
-            mock_client.aio.models.generate_content = AsyncMock(
-                side_effect=[mock_response, mock_response_2]
-            )
-
-            with patch(
-                "app.tools.registry.ToolRegistry.execute_tool", new_callable=AsyncMock
-            ) as mock_execute:
-                mock_execute.side_effect = Exception("API error: Invalid symbol")
-
-                provider = GeminiProvider("test-key")
-                text, calls = await provider.generate_with_tools(
-                    system_prompt="Test", user_message="Check INVALID stock", tools=[MagicMock()]
-                )
-
-                # Even on error, the tool call should be recorded
-                assert len(calls) == 1
-                assert calls[0]["name"] == "get_stock_quote"
-                assert "error" in calls[0]["result"].lower() or "API error" in calls[0]["result"]
-
-    @pytest.mark.asyncio
-    async def test_generate_with_tools_max_iterations(self):
+        gemini_client.aio.models.generate_content = _replay(
+            [
+                _tool_call_response("get_stock_quote", {"symbol": "INVALID"}),
+                _text_response("Could not fetch stock data."),
+            ]
+        )
+
+        execute_tool.side_effect = Exception("API error: Invalid symbol")
+
+        text, calls = await gemini_provider.generate_with_tools(
+            system_prompt="Test", user_message="Check INVALID stock", tools=[MagicMock()]
+        )
+
+        # Even on error, the tool call should be recorded
+        assert len(calls) == 1
+        assert calls[0]["name"] == "get_stock_quote"
+        assert "error" in calls[0]["result"].lower() or "API error" in calls[0]["result"]
+
+    async def test_generate_with_tools_max_iterations(
+        self, gemini_client, gemini_provider, execute_tool
+    ):
         """Test generate_with_tools with max tool iterations reached."""
-        with patch("app.providers.gemini_provider.genai.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-            mock_client.aio = MagicMock()
-
-            # All responses have function calls (will hit max iterations = 5)
-            mock_fc = MagicMock()
-            mock_fc.name = "get_stock_quote"
-            mock_fc.args = {"symbol": "AAPL"}
-
-            mock_part = MagicMock()
-            mock_part.function_call = mock_fc
-
-            mock_candidate = MagicMock()
-            mock_candidate.content.parts = [mock_part]
-
-            mock_response = MagicMock()
-            mock_response.candidates = [mock_candidate]
-            mock_response.text = None
-
-            # Return the same response 6 times (more than max iterations)
-            mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
-
-            with patch(
-                "app.tools.registry.ToolRegistry.execute_tool", new_callable=AsyncMock
-            ) as mock_execute:
-                mock_execute.return_value = {"price": 150}
-
-                provider = GeminiProvider("test-key")
-                text, calls = await provider.generate_with_tools(
-                    system_prompt="Test",
-                    user_message="Analyze AAPL",
-                    tools=[MagicMock()],
-                    max_tokens=1000,
-                )
-
-                # Should have made 5 tool calls (max iterations)
-                assert len(calls) == 5
-                for call in calls:
-                    assert call["name"] == "get_stock_quote"
-
-    @pytest.mark.asyncio
-    async def test_generate_with_tools_empty_response(self):
-        """Test generate_with_tools with empty candidate response."""
-        with patch("app.providers.gemini_provider.genai.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-            mock_client.aio = MagicMock()
+        # Every response asks for another tool call, so the loop stops at its limit of 5
+        gemini_client.aio.models.generate_content = _replay(itertools.repeat(_AAPL_QUOTE_CALL))
 
-            # Response with no candidates
-            mock_response = MagicMock()
-            mock_response.candidates = []
-            mock_response.text = ""
+        execute_tool.return_value = {"price": 150}
 
-            mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
+        text, calls = await gemini_provider.generate_with_tools(
+            system_prompt="Test",
+            user_message="Analyze AAPL",
+            tools=[MagicMock()],
+            max_tokens=1000,
+        )
 
-            provider = GeminiProvider("test-key")
-            text, calls = await provider.generate_with_tools(
-                system_prompt="Test", user_message="Hello!", tools=[MagicMock()]
-            )
+        # Should have made 5 tool calls (max iterations)
+        assert len(calls) == 5
+        for call in calls:
+            assert call["name"] == "get_stock_quote"
 
-            assert text == ""
+    async def test_generate_with_tools_empty_response(self, gemini_client, gemini_provider):
+        """Test generate_with_tools with empty candidate response."""
+        gemini_client.aio.models.generate_content.return_value = types.GenerateContentResponse(
+            candidates=[]
+        )
 
-    @pytest.mark.asyncio
-    async def test_generate_with_tools_model_override(self):
+        text, calls = await gemini_provider.generate_with_tools(
+            system_prompt="Test", user_message="Hello!", tools=[MagicMock()]
+        )
+
+        assert text == ""
+
+    async def test_generate_with_tools_model_override(self, gemini_client, gemini_provider):
         """Test generate_with_tools with custom model override."""
-        with patch("app.providers.gemini_provider.genai.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-            mock_client.aio = MagicMock()
-
-            mock_candidate = MagicMock()
-            mock_candidate.content.parts = []
-
-            mock_response = MagicMock()
-            mock_response.candidates = [mock_candidate]
-            mock_response.text = "Response from custom model"
-
-            mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
-
-            provider = GeminiProvider("test-key")
-            text, calls = await provider.generate_with_tools(
-                system_prompt="Test",
-                user_message="Hello!",
-                tools=[MagicMock()],
-                model="gemini-1.5-pro",
-            )
-
-            assert text == "Response from custom model"
-            mock_client.aio.models.generate_content.assert_called_once()
-            call_kwargs = mock_client.aio.models.generate_content.call_args
-            assert call_kwargs.kwargs.get("model") == "gemini-1.5-pro"
+        gemini_client.aio.models.generate_content.return_value = _text_response(
+            "Response from custom model"
+        )
+
+        text, calls = await gemini_provider.generate_with_tools(
+            system_prompt="Test",
+            user_message="Hello!",
+            tools=[MagicMock()],
+            model="gemini-1.5-pro",
+        )
+
+        assert text == "Response from custom model"
+        generate_content = gemini_client.aio.models.generate_content
+        assert generate_content.await_count == 1
+        assert generate_content.call_args.kwargs["model"] == "gemini-1.5-pro"
@@ -2,49 +2,62 @@
 Tests for Storage Module
 """
 
-from uuid import uuid4
-
-import pytest
-
-from app.models import Debate, DebateStatus
+from uuid import UUID, uuid4
+
+from app.models import (
+    AgentResponse,
+    Debate,
+    DebateRound,
+    DebateStatus,
+    VoteType,
+)
 from app.storage import Storage
 
+# uuid4() never yields the nil UUID, so no saved council or debate can have this id
+_UNKNOWN_ID = UUID(int=0)
+
 
 class TestStorageCouncils:
     """Tests for council storage operations."""
 
-    @pytest.mark.asyncio
-    async def test_initialize_creates_database(self, tmp_path):
-        """Test initializing storage creates the database file."""
-        db_path = tmp_path / "agentscouncil.db"
-        Storage.configure(db_path)
-
-        await Storage.initialize()
-
-        assert db_path.exists()
-
-    @pytest.mark.asyncio
     async def test_configure_resets_database_path(self, tmp_path):
-        """Test configure resets initialization for new database paths."""
+        """Test initialize creates the database and configure resets it for new paths."""
         first_path = tmp_path / "first.db"
         second_path = tmp_path / "second.db"
 
         Storage.configure(first_path)
         await Storage.initialize()
+        assert first_path.exists()
 
         Storage.configure(second_path)
         await Storage.initialize()
 
         assert second_path.exists()
 
-    @pytest.mark.asyncio
+    async def test_fast_connections_relax_synchronous(self, storage_db):
+        """Test fast mode connections use synchronous=NORMAL."""
+        async with Storage._connect() as connection:
+            cursor = await connection.execute("PRAGMA synchronous;")
+            (synchronous,) = await cursor.fetchone()
+
+        # SQLite reports NORMAL as 1 (FULL is 2)
+        assert synchronous == 1
+
+    async def test_connections_are_reused(self):
+        """Test a released connection is handed to the next caller."""
+        async with Storage._connect() as first:
+            pass
+        async with Storage._connect() as second:
+            pass
+
+        assert second is first
+
     async def test_save_council(self, sample_council):
         """Test saving a council."""
         result = await Storage.save_council(sample_council)
         assert result.id == sample_council.id
         assert result.name == sample_council.name
 
-    @pytest.mark.asyncio
     async def test_get_council(self, sample_council):
         """Test retrieving a saved council."""
         await Storage.save_council(sample_council)
@@ -53,19 +66,16 @@ class TestStorageCouncils:
         assert result.id == sample_council.id
         assert result.name == sample_council.name
 
-    @pytest.mark.asyncio
     async def test_get_council_not_found(self):
         """Test retrieving a non-existent council."""
-        result = await Storage.get_council(uuid4())
+        result = await Storage.get_council(_UNKNOWN_ID)
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_list_councils_empty(self):
         """Test listing councils when none exist."""
         result = await Storage.list_councils()
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_list_councils(self, sample_council):
         """Test listing councils."""
         await Storage.save_council(sample_council)
@@ -73,7 +83,6 @@ class TestStorageCouncils:
         assert len(result) == 1
         assert result[0].id == sample_council.id
 
-    @pytest.mark.asyncio
     async def test_delete_council(self, sample_council):
         """Test deleting a council."""
         await Storage.save_council(sample_council)
@@ -81,24 +90,21 @@ class TestStorageCouncils:
         assert result is True
         assert await Storage.get_council(sample_council.id) is None
 
-    @pytest.mark.asyncio
     async def test_delete_council_not_found(self):
         """Test deleting a non-existent council."""
-        result = await Storage.delete_council(uuid4())
+        result = await Storage.delete_council(_UNKNOWN_ID)
         assert result is False
 
 
 class TestStorageDebates:
     """Tests for debate storage operations."""
 
-    @pytest.mark.asyncio
     async def test_save_debate(self, sample_debate):
         """Test saving a debate."""
         result = await Storage.save_debate(sample_debate)
         assert result.id == sample_debate.id
         assert result.topic == sample_debate.topic
 
-    @pytest.mark.asyncio
     async def test_get_debate(self, sample_debate):
         """Test retrieving a saved debate."""
         await Storage.save_debate(sample_debate)
@@ -106,19 +112,35 @@ class TestStorageDebates:
         assert result is not None
         assert result.id == sample_debate.id
 
-    @pytest.mark.asyncio
+    async def test_get_debate_keeps_vote_confidence(self, sample_debate, sample_agent_openai):
+        """Test a response's vote confidence survives a save and reload."""
+        response = AgentResponse(
+            agent_id=sample_agent_openai.id,
+            agent_name=sample_agent_openai.name,
+            role=sample_agent_openai.role,
+            provider=sample_agent_openai.provider,
+            content="",
+            vote=VoteType.AGREE,
+            confidence=0.75,
+        )
+        sample_debate.rounds.append(DebateRound(round_number=1, responses=[response]))
+        await Storage.save_debate(sample_debate)
+
+        result = await Storage.get_debate(sample_debate.id)
+
+        assert result is not None
+        assert result.rounds[0].responses[0].confidence == 0.75
+
     async def test_get_debate_not_found(self):
         """Test retrieving a non-existent debate."""
-        result = await Storage.get_debate(uuid4())
+        result = await Storage.get_debate(_UNKNOWN_ID)
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_list_debates_empty(self):
         """Test listing debates when none exist."""
         result = await Storage.list_debates()
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_list_debates(self, sample_debate):
         """Test listing debates."""
         await Storage.save_debate(sample_debate)
@@ -126,7 +148,6 @@ class TestStorageDebates:
         assert len(result) == 1
         assert result[0].id == sample_debate.id
 
-    @pytest.mark.asyncio
     async def test_list_debates_filter_by_council(self, sample_debate):
         """Test filtering debates by council_id."""
         await Storage.save_debate(sample_debate)
@@ -142,7 +163,18 @@ class TestStorageDebates:
         assert len(result) == 1
         assert result[0].id == sample_debate.id
 
-    @pytest.mark.asyncio
+    async def test_list_debates_by_council_uses_index(self):
+        """Test filtering debates by council is served by an index."""
+        async with Storage._connect() as connection:
+            cursor = await connection.execute(
+                "EXPLAIN QUERY PLAN "
+                "SELECT * FROM debates WHERE council_id = ? ORDER BY created_at ASC",
+                (str(_UNKNOWN_ID),),
+            )
+            plan = " ".join(row[-1] for row in await cursor.fetchall())
+
+        assert "idx_debates_council" in plan
+
     async def test_update_debate_status(self, sample_debate):
         """Test updating a debate's status."""
         await Storage.save_debate(sample_debate)
@@ -155,7 +187,6 @@ class TestStorageDebates:
         assert result is not None
         assert result.status == DebateStatus.CONSENSUS_REACHED
 
-    @pytest.mark.asyncio
     async def test_update_debate_error(self, sample_debate):
         """Test updating debate with error message."""
         await Storage.save_debate(sample_debate)
@@ -173,7 +204,6 @@ class TestStorageDebates:
 class TestStorageClear:
     """Tests for storage clear functionality."""
 
-    @pytest.mark.asyncio
     async def test_clear_storage(self, sample_council, sample_debate):
         """Test clearing all storage."""
         await Storage.save_council(sample_council)
@@ -3,11 +3,19 @@ Tests for Tool Registry
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, NonCallableMagicMock
 from app.tools.registry import ToolRegistry
+from app.tools.stock_tools import StockTools
 
 
 class TestToolRegistry:
+    @pytest.fixture
+    def mock_tools(self, monkeypatch) -> NonCallableMagicMock:
+        """Hand execute_tool a stand-in StockTools."""
+        tools = NonCallableMagicMock()
+        monkeypatch.setattr("app.tools.registry.get_stock_tools", lambda: tools)
+        return tools
+
     def test_get_gemini_tools(self):
         """Test tool definitions for Gemini."""
         tools = ToolRegistry.get_gemini_tools()
@@ -19,56 +27,49 @@ class TestToolRegistry:
         assert "get_stock_news" in names
         assert "get_market_summary" in names
 
-    @pytest.mark.asyncio
-    async def test_execute_tool_quote(self):
+    def test_get_gemini_tools_is_built_once(self):
+        """Test repeated calls share one tool list."""
+        assert ToolRegistry.get_gemini_tools() is ToolRegistry.get_gemini_tools()
+
+    async def test_execute_tool_quote(self, mock_tools):
         """Test tool execution by name."""
-        with patch("app.tools.registry.get_stock_tools") as mock_get_tools:
-            mock_tools = MagicMock()
-            mock_get_tools.return_value = mock_tools
-            mock_tools.get_stock_quote = AsyncMock(return_value={"price": 100})
+        mock_tools.get_stock_quote = AsyncMock(return_value={"price": 100})
 
-            result = await ToolRegistry.execute_tool("get_stock_quote", {"symbol": "TSLA"})
+        result = await ToolRegistry.execute_tool("get_stock_quote", {"symbol": "TSLA"})
 
-            assert result["price"] == 100
-            mock_tools.get_stock_quote.assert_called_once_with(symbol="TSLA")
+        assert result["price"] == 100
+        mock_tools.get_stock_quote.assert_called_once_with(symbol="TSLA")
 
-    @pytest.mark.asyncio
-    async def test_execute_tool_news(self):
+    async def test_execute_tool_news(self, mock_tools):
         """Test executing get_stock_news tool."""
-        with patch("app.tools.registry.get_stock_tools") as mock_get_tools:
-            mock_tools = MagicMock()
-            mock_get_tools.return_value = mock_tools
-            mock_news = [{"title": " Earnings Report", "source": "TestSource"}]
-            mock_tools.get_stock_news = AsyncMock(return_value=mock_news)
+        mock_news = [{"title": " Earnings Report", "source": "TestSource"}]
+        mock_tools.get_stock_news = AsyncMock(return_value=mock_news)
 
-            result = await ToolRegistry.execute_tool("get_stock_news", {"symbol": "AAPL"})
+        result = await ToolRegistry.execute_tool("get_stock_news", {"symbol": "AAPL"})
 
-            assert len(result) == 1
-            assert result[0]["title"] == " Earnings Report"
-            mock_tools.get_stock_news.assert_called_once_with(symbol="AAPL")
+        assert len(result) == 1
+        assert result[0]["title"] == " Earnings Report"
+        mock_tools.get_stock_news.assert_called_once_with(symbol="AAPL")
 
-    @pytest.mark.asyncio
-    async def test_execute_tool_market_summary(self):
+    async def test_execute_tool_market_summary(self, mock_tools):
         """Test executing get_market_summary tool."""
-        with patch("app.tools.registry.get_stock_tools") as mock_get_tools:
-            mock_tools = MagicMock()
-            mock_get_tools.return_value = mock_tools
-            mock_summary = {"sp500": 4500.0, "nasdaq": 14000.0}
-            mock_tools.get_market_summary = AsyncMock(return_value=mock_summary)
+        mock_summary = {"sp500": 4500.0, "nasdaq": 14000.0}
+        mock_tools.get_market_summary = AsyncMock(return_value=mock_summary)
 
-            result = await ToolRegistry.execute_tool("get_market_summary", {})
+        result = await ToolRegistry.execute_tool("get_market_summary", {})
 
-            assert result["sp500"] == 4500.0
-            mock_tools.get_market_summary.assert_called_once_with()
+        assert result["sp500"] == 4500.0
+        mock_tools.get_market_summary.assert_called_once_with()
 
-    @pytest.mark.asyncio
-    async def test_execute_unknown_tool(self):
-        """Test executing unknown tool raises ValueError."""
-        with patch("app.tools.registry.get_stock_tools") as mock_get_tools:
-            mock_get_tools.return_value = MagicMock()
+    def test_declared_tools_are_implemented(self):
+        """Test every declared tool has a StockTools method to dispatch to."""
+        for name in ToolRegistry.TOOL_NAMES:
+            assert callable(getattr(StockTools, name, None)), name
 
-            with pytest.raises(ValueError, match="Unknown tool: nonexistent_tool"):
-                await ToolRegistry.execute_tool("nonexistent_tool", {"arg": "value"})
+    async def test_execute_unknown_tool(self, mock_tools):
+        """Test executing unknown tool raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown tool: nonexistent_tool"):
+            await ToolRegistry.execute_tool("nonexistent_tool", {"arg": "value"})
 
     def test_tool_declarations_have_required_fields(self):
         """Test that all tool declarations have required description and parameters."""
@@ -115,26 +116,18 @@ class TestToolRegistry:
         assert hasattr(tools[0], "function_declarations")
         assert len(tools[0].function_declarations) == 3
 
-    @pytest.mark.asyncio
-    async def test_execute_tool_with_empty_args(self):
+    async def test_execute_tool_with_empty_args(self, mock_tools):
         """Test tool execution with empty arguments when no args needed."""
-        with patch("app.tools.registry.get_stock_tools") as mock_get_tools:
-            mock_tools = MagicMock()
-            mock_get_tools.return_value = mock_tools
-            mock_tools.get_market_summary = AsyncMock(return_value={})
+        mock_tools.get_market_summary = AsyncMock(return_value={})
 
-            result = await ToolRegistry.execute_tool("get_market_summary", {})
+        result = await ToolRegistry.execute_tool("get_market_summary", {})
 
-            assert result == {}
-            mock_tools.get_market_summary.assert_called_once()
+        assert result == {}
+        mock_tools.get_market_summary.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_execute_tool_exception_handling(self):
+    async def test_execute_tool_exception_handling(self, mock_tools):
         """Test that tool exceptions are properly propagated."""
-        with patch("app.tools.registry.get_stock_tools") as mock_get_tools:
-            mock_tools = MagicMock()
-            mock_get_tools.return_value = mock_tools
-            mock_tools.get_stock_quote = AsyncMock(side_effect=Exception("API error"))
+        mock_tools.get_stock_quote = AsyncMock(side_effect=Exception("API error"))
 
-            with pytest.raises(Exception, match="API error"):
-                await ToolRegistry.execute_tool("get_stock_quote", {"symbol": "INVALID"})
+        with pytest.raises(Exception, match="API error"):
+            await ToolRegistry.execute_tool("get_stock_quote", {"symbol": "INVALID"})
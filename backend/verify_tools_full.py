@@ -5,20 +5,23 @@ import asyncio
 import os
 import logging
 from dotenv import load_dotenv
-from app.providers.gemini_provider import GeminiProvider
-from app.tools import INVESTMENT_TOOLS
 from app.models import RoleType
 
-# Load environment variables
-load_dotenv()
-
 async def main():
     logging.basicConfig(level=logging.INFO)
     api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or api_key.startswith("AIza") is False:
+    if api_key is None:
+        # Only parse .env when the environment doesn't already provide the key
+        load_dotenv()
+        api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key or not api_key.startswith("AIza"):
         print(f"GEMINI_API_KEY not found or invalid in .env: {api_key}")
         return
 
+    # Imported after the key check so a bad key fails before the SDK and tools load
+    from app.providers.gemini_provider import GeminiProvider
+    from app.tools import INVESTMENT_TOOLS
+
     provider = GeminiProvider(api_key)
     
     system_prompt = """You are an Investment Advisor. 